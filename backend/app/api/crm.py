@@ -18,7 +18,13 @@ from app.api.crm_sync_endpoints import (
     get_fub_sync_health,
 )
 from app.core.auth import CurrentUser, user_id_to_uuid
-from app.core.cache import cache_get, cache_invalidate, cache_set
+from app.core.cache import (
+    cache_delete,
+    cache_get,
+    cache_invalidate_index,
+    cache_set,
+    cache_set_indexed,
+)
 from app.core.limiter import limiter
 from app.db.session import get_db
 from app.models.appointment import Appointment
@@ -387,7 +393,7 @@ async def list_contacts(
         )
 
     # Cache for 5 minutes (300 seconds)
-    await cache_set(cache_key, contacts_data, ttl=300)
+    await cache_set_indexed(cache_key, contacts_data, f"crm:contacts:list:{user_id}:keys", ttl=300)
     logger.debug("Cached contacts list for 5 minutes")
     return contacts_data
 
@@ -510,12 +516,11 @@ async def create_contact(
         # Invalidate CRM caches after creating a contact
         try:
             # Invalidate contacts list cache so new contacts appear immediately
-            list_invalidated = await cache_invalidate(f"crm:contacts:list:{user_id}:*")
-            stats_invalidated = await cache_invalidate("crm:stats:*")
+            list_invalidated = await cache_invalidate_index(f"crm:contacts:list:{user_id}:keys")
+            await cache_delete(f"crm:stats:{user_id}")
             logger.debug(
-                "Invalidated %d list cache keys and %d stats cache keys after contact creation",
+                "Invalidated %d list cache keys and stats cache after contact creation",
                 list_invalidated,
-                stats_invalidated,
             )
         except Exception:
             logger.exception("Failed to invalidate cache after contact creation")
@@ -732,9 +737,9 @@ async def update_contact(
 
         # Invalidate caches
         try:
-            await cache_invalidate(f"crm:contact:{user_id}:{contact_id}")
-            await cache_invalidate(f"crm:contacts:list:{user_id}:*")
-            await cache_invalidate("crm:stats:*")
+            await cache_delete(f"crm:contact:{user_id}:{contact_id}")
+            await cache_invalidate_index(f"crm:contacts:list:{user_id}:keys")
+            await cache_delete(f"crm:stats:{user_id}")
         except Exception:
             logger.exception("Failed to invalidate cache after contact update")
 
@@ -828,9 +833,9 @@ async def delete_contact(
 
         # Invalidate caches
         try:
-            await cache_invalidate(f"crm:contact:{user_id}:{contact_id}")
-            await cache_invalidate(f"crm:contacts:list:{user_id}:*")
-            await cache_invalidate("crm:stats:*")
+            await cache_delete(f"crm:contact:{user_id}:{contact_id}")
+            await cache_invalidate_index(f"crm:contacts:list:{user_id}:keys")
+            await cache_delete(f"crm:stats:{user_id}")
         except Exception:
             logger.exception("Failed to invalidate cache after contact deletion")
 
@@ -1314,7 +1319,7 @@ async def create_appointment(
             # Don't fail appointment creation if sync queueing fails
 
         # Invalidate stats cache
-        await cache_invalidate("crm:stats:*")
+        await cache_delete(f"crm:stats:{user_id}")
 
         scheduled_at_str = (
             appointment.scheduled_at.isoformat()
@@ -1420,7 +1425,7 @@ async def update_appointment(
             # Don't fail appointment update if sync queueing fails
 
         # Invalidate stats cache
-        await cache_invalidate("crm:stats:*")
+        await cache_delete(f"crm:stats:{user_id}")
 
         scheduled_at_str = (
             appointment.scheduled_at.isoformat()
@@ -1487,7 +1492,7 @@ async def delete_appointment(
         logger.info("Deleted appointment: id=%d", appointment_id)
 
         # Invalidate stats cache
-        await cache_invalidate("crm:stats:*")
+        await cache_delete(f"crm:stats:{user_id}")
 
     except DBAPIError as e:
         await db.rollback()
@@ -5,7 +5,7 @@ import uuid as uuid_module
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -53,14 +53,16 @@ async def enqueue_calendar_sync_retry(
             if provider in integrations:
                 # Check if pending sync already exists
                 existing = await db.execute(
-                    select(CalendarSyncQueue).where(
-                        CalendarSyncQueue.appointment_id == appointment.id,
-                        CalendarSyncQueue.calendar_provider == provider,
-                        CalendarSyncQueue.operation == operation,
-                        CalendarSyncQueue.status.in_(["pending", "processing"]),
+                    select(
+                        exists().where(
+                            CalendarSyncQueue.appointment_id == appointment.id,
+                            CalendarSyncQueue.calendar_provider == provider,
+                            CalendarSyncQueue.operation == operation,
+                            CalendarSyncQueue.status.in_(["pending", "processing"]),
+                        )
                     )
                 )
-                if existing.scalar_one_or_none():
+                if existing.scalar():
                     logger.debug(
                         "Sync already queued, skipping: appointment_id=%d, provider=%s",
                         appointment.id,
@@ -11,6 +11,7 @@ from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import CurrentUser, user_id_to_uuid
+from app.core.cache import cache_invalidate_index
 from app.db.session import get_db
 from app.models.user_integration import UserIntegration
 from app.models.workspace import Workspace
@@ -84,6 +85,18 @@ def mask_credentials(credentials: dict[str, Any]) -> list[str]:
     return [key for key, value in credentials.items() if value]
 
 
+async def _invalidate_calendar_providers_cache(user_id: uuid.UUID) -> None:
+    """Clear cached calendar providers for all of a user's workspaces.
+
+    User-level integrations apply to every workspace, so a change to any
+    integration clears the user's entries rather than a single workspace's.
+
+    Args:
+        user_id: User ID (UUID)
+    """
+    await cache_invalidate_index(f"integrations:calendar_providers:{user_id}:keys")
+
+
 @router.get("", response_model=IntegrationListResponse)
 async def list_integrations(
     current_user: CurrentUser,
@@ -279,6 +292,7 @@ async def connect_integration(
     db.add(integration)
     await db.commit()
     await db.refresh(integration)
+    await _invalidate_calendar_providers_cache(user_uuid)
 
     # Start FUB sync worker if this is the first FUB integration (conditional worker)
     if request.integration_id == "followupboss":
@@ -369,6 +383,7 @@ async def update_integration(
     db.add(integration)
     await db.commit()
     await db.refresh(integration)
+    await _invalidate_calendar_providers_cache(user_uuid)
 
     return IntegrationResponse(
         id=str(integration.id),
@@ -430,6 +445,7 @@ async def disconnect_integration(
 
     await db.delete(integration)
     await db.commit()
+    await _invalidate_calendar_providers_cache(user_uuid)
 
 
 async def get_integration_credentials(
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.auth import CurrentUser
+from app.core.cache import cache_delete
 from app.core.limiter import limiter
 from app.db.session import get_db
 from app.models.agent import Agent
@@ -360,6 +361,10 @@ async def update_workspace(
 
         logger.info("Updated workspace: id=%s", workspace.id)
 
+        # CRM tools cache the workspace timezone from settings
+        if "settings" in update_data:
+            await cache_delete(f"workspace:timezone:{workspace.id}")
+
         return {
             "id": str(workspace.id),
             "user_id": workspace.user_id,
@@ -137,6 +137,69 @@ async def cache_invalidate(pattern: str) -> int:
         return 0
 
 
+async def cache_set_indexed(key: str, value: Any, index_key: str, ttl: int = 300) -> bool:
+    """Set value in cache and record its key in an index set.
+
+    Keys stored this way can be dropped with cache_invalidate_index(), which
+    reads the index instead of scanning the whole keyspace. The index expires
+    with the most recently stored key, so keys sharing an index should share a TTL.
+
+    Args:
+        key: Cache key
+        value: Value to cache (must be JSON serializable)
+        index_key: Redis set tracking keys that are invalidated together
+        ttl: Time to live in seconds (default: 300)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        redis = await get_redis()
+        serialized = json.dumps(value, default=str)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.setex(key, ttl, serialized)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+        logger.debug("Cache set: %s in index %s (TTL: %ss)", key, index_key, ttl)
+        return True
+
+    except Exception:
+        logger.exception("Error setting cache key '%s' in index '%s'", key, index_key)
+        return False
+
+
+async def cache_invalidate_index(index_key: str) -> int:
+    """Invalidate all cache keys recorded in an index set.
+
+    Only the keys read from the index are removed from it, so keys indexed
+    while the invalidation runs are kept track of.
+
+    Args:
+        index_key: Redis set populated by cache_set_indexed()
+
+    Returns:
+        Number of keys deleted
+    """
+    try:
+        redis = await get_redis()
+        keys = list(await redis.smembers(index_key))
+
+        if not keys:
+            return 0
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*keys)
+            pipe.srem(index_key, *keys)
+            deleted, _ = await pipe.execute()
+        logger.info("Cache invalidated: %s keys in index '%s'", deleted, index_key)
+        return int(deleted)
+
+    except Exception:
+        logger.exception("Error invalidating cache index '%s'", index_key)
+        return 0
+
+
 def cached(
     prefix: str,
     ttl: int = 300,
@@ -57,6 +57,8 @@ from app.services.slicktext_polling_service import (
     start_slicktext_polling,
     stop_slicktext_polling,
 )
+from app.services.tools.calcom_tools import close_shared_clients as close_calcom_clients
+from app.services.tools.followupboss_tools import close_shared_clients as close_fub_clients
 
 # Configure structured logging with async processors
 structlog.configure(
@@ -214,6 +216,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0912
     except Exception:
         logger.exception("Error stopping campaign worker")
 
+    # Close shared Cal.com HTTP connection pools
+    try:
+        await close_calcom_clients()
+        logger.info("Cal.com HTTP clients closed")
+    except Exception:
+        logger.exception("Error closing Cal.com HTTP clients")
+
+    # Close shared FollowUpBoss HTTP connection pools
+    try:
+        await close_fub_clients()
+        logger.info("FollowUpBoss HTTP clients closed")
+    except Exception:
+        logger.exception("Error closing FollowUpBoss HTTP clients")
+
     # Close Redis connection
     try:
         await close_redis()
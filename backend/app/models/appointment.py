@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -18,6 +18,15 @@ class Appointment(Base, TimestampMixin):
     """Appointment model - bookings made via voice agents."""
 
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Workspace schedules filtered by status and read in time order (migration 029)
+        Index(
+            "ix_appointments_workspace_id_status_scheduled_at",
+            "workspace_id",
+            "status",
+            "scheduled_at",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     contact_id: Mapped[int] = mapped_column(ForeignKey("contacts.id"), nullable=False, index=True)
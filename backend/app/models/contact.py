@@ -3,7 +3,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text, Uuid
+from sqlalchemy import ForeignKey, Index, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -18,6 +18,21 @@ class Contact(Base, TimestampMixin):
     """Contact model for CRM - represents people who call or are called by voice agents."""
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Scoped caller lookups by phone number (migration 027)
+        Index("ix_contacts_workspace_id_phone_number", "workspace_id", "phone_number"),
+        Index("ix_contacts_user_id_phone_number", "user_id", "phone_number"),
+        # pg_trgm indexes serving search_customer's ILIKE matches (migration 028)
+        *(
+            Index(
+                f"ix_contacts_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("first_name", "last_name", "email", "phone_number")
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
@@ -1,5 +1,6 @@
 """GPT Realtime API service for Premium tier voice agents."""
 
+import asyncio
 import json
 import types
 import uuid
@@ -178,6 +179,7 @@ class GPTRealtimeSession:
         # Initial greeting (triggered after event loop starts to avoid race condition)
         self._pending_initial_greeting: str | None = None
         self._greeting_triggered: bool = False
+        self._warmup_task: asyncio.Task[None] | None = None
         self.logger = logger.bind(
             component="gpt_realtime",
             session_id=self.session_id,
@@ -243,6 +245,15 @@ class GPTRealtimeSession:
         self.logger.info("configuring_session_after_connection")
         await self._configure_session()
 
+        # Warm integration connections in the background so the first tool call
+        # doesn't pay the TCP/TLS handshake while the caller is waiting
+        self._warmup_task = asyncio.create_task(
+            self.tool_registry.warmup(
+                self.agent_config.get("enabled_tools", []),
+                self.agent_config.get("integration_settings", {}),
+            )
+        )
+
         self.logger.info("gpt_realtime_session_initialized")
 
     async def _connect_realtime_api(self) -> None:
@@ -713,6 +724,9 @@ class GPTRealtimeSession:
             except Exception as e:
                 self.logger.warning("connection_close_failed", error=str(e))
 
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+
         # Cleanup tool registry
         if self.tool_registry:
             # No cleanup needed for internal tools
@@ -8,6 +8,7 @@ Latest models (Dec 2025):
 - EVI 4-mini: Multilingual (11 languages), lower latency
 """
 
+import asyncio
 import json
 import types
 import uuid
@@ -203,6 +204,7 @@ class HumeEVISession:
         # Pending greeting
         self._pending_initial_greeting: str | None = None
         self._greeting_triggered: bool = False
+        self._warmup_task: asyncio.Task[None] | None = None
         self.logger = logger.bind(
             component="hume_evi",
             session_id=self.session_id,
@@ -247,6 +249,14 @@ class HumeEVISession:
         # Connect to Hume EVI
         await self._connect_evi()
 
+        # Pre-open integration connections (e.g. Cal.com) without blocking startup
+        self._warmup_task = asyncio.create_task(
+            self.tool_registry.warmup(
+                self.agent_config.get("enabled_tools", []),
+                self.agent_config.get("integration_settings", {}),
+            )
+        )
+
         self.logger.info("hume_evi_session_initialized")
 
     async def _connect_evi(self) -> None:  # noqa: PLR0915
@@ -540,6 +550,9 @@ Current: {current_datetime}
 
         self.flush_assistant_text()
 
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+
         if self.socket:
             try:
                 await self.socket.close()
@@ -348,8 +348,8 @@ async def generate_text_response(  # noqa: PLR0912, PLR0915
         if assistant_message.tool_calls:
             log.info("executing_tool_calls", count=len(assistant_message.tool_calls))
 
-            # Execute each tool call
-            tool_results: list[dict[str, Any]] = []
+            # Parse every tool call first so independent HTTP tools can run together
+            calls: list[tuple[str, dict[str, Any]]] = []
             for tool_call in assistant_message.tool_calls:
                 tool_name = tool_call.function.name
                 try:
@@ -363,9 +363,20 @@ async def generate_text_response(  # noqa: PLR0912, PLR0915
                     arguments=arguments,
                     agent_id=str(agent.id),
                 )
-                result = await tool_registry.execute_tool(
-                    tool_name, arguments, agent_id=str(agent.id)
-                )
+                calls.append((tool_name, arguments))
+
+            if len(calls) > 1:
+                results = await tool_registry.execute_tools(calls, agent_id=str(agent.id))
+            else:
+                tool_name, arguments = calls[0]
+                results = [
+                    await tool_registry.execute_tool(tool_name, arguments, agent_id=str(agent.id))
+                ]
+
+            tool_results: list[dict[str, Any]] = []
+            for tool_call, (tool_name, arguments), result in zip(
+                assistant_message.tool_calls, calls, results, strict=True
+            ):
                 log.info(
                     "tool_execution_result",
                     tool=tool_name,
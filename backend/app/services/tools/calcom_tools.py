@@ -1,16 +1,281 @@
 """Cal.com integration tools for voice agents."""
 
+import asyncio
+import contextlib
+import time
 from collections.abc import Awaitable, Callable
+from functools import wraps
 from http import HTTPStatus
-from typing import Any
+from typing import Any, ParamSpec
 
 import httpx
+import orjson
 import structlog
 
+from app.services.tools.http_client_pool import SharedClientPool
+
 logger = structlog.get_logger()
 
 ToolHandler = Callable[..., Awaitable[dict[str, Any]]]
 
+P = ParamSpec("P")
+
+# Keep connections warm between tool calls in the same conversation turn
+# (event types -> availability -> booking) instead of re-handshaking each time
+CLIENT_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Transient failures worth retrying. Connection errors are retried by the transport
+# for every method (nothing was sent yet); status codes only for idempotent requests
+CONNECT_RETRIES = 2
+IDEMPOTENT_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.25
+RETRYABLE_STATUS_CODES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+# Event types rarely change; availability is re-checked often during a booking call
+EVENT_TYPES_CACHE_TTL_SECONDS = 60.0
+AVAILABILITY_CACHE_TTL_SECONDS = 30.0
+
+
+# OpenAI function calling tool definitions, built once at import time.
+# Shared by every session, so callers must treat the dicts as read-only.
+_TOOL_DEFINITIONS: list[dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_get_event_types",
+            "description": "Get available event types (meeting types) that can be scheduled on Cal.com",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_get_availability",
+            "description": "Get available time slots for booking on a specific date range",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "event_type_id": {
+                        "type": "integer",
+                        "description": "The event type ID (from calcom_get_event_types)",
+                    },
+                    "start_date": {
+                        "type": "string",
+                        "description": "Start date for availability check (YYYY-MM-DD format)",
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "End date for availability check (YYYY-MM-DD format)",
+                    },
+                },
+                "required": ["event_type_id", "start_date", "end_date"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_create_booking",
+            "description": "Create a booking/appointment directly on Cal.com. Unlike Calendly, Cal.com supports direct booking without requiring the customer to click a link.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "event_type_id": {
+                        "type": "integer",
+                        "description": "The event type ID to book",
+                    },
+                    "start_time": {
+                        "type": "string",
+                        "description": "Start time in ISO 8601 format (e.g., '2024-01-20T10:00:00Z')",
+                    },
+                    "attendee_email": {
+                        "type": "string",
+                        "description": "Email of the person booking the appointment",
+                    },
+                    "attendee_name": {
+                        "type": "string",
+                        "description": "Full name of the person booking",
+                    },
+                    "attendee_timezone": {
+                        "type": "string",
+                        "description": "Attendee's timezone (e.g., 'America/New_York', 'UTC')",
+                    },
+                    "notes": {
+                        "type": "string",
+                        "description": "Additional notes or special requests for the booking",
+                    },
+                },
+                "required": [
+                    "event_type_id",
+                    "start_time",
+                    "attendee_email",
+                    "attendee_name",
+                ],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_list_bookings",
+            "description": "List bookings/appointments, optionally filtered by date range or status",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "status": {
+                        "type": "string",
+                        "enum": ["upcoming", "past", "cancelled"],
+                        "description": "Filter bookings by status",
+                    },
+                    "after_start": {
+                        "type": "string",
+                        "description": "Filter bookings starting after this date (ISO 8601)",
+                    },
+                    "before_start": {
+                        "type": "string",
+                        "description": "Filter bookings starting before this date (ISO 8601)",
+                    },
+                    "attendee_email": {
+                        "type": "string",
+                        "description": "Filter bookings by attendee email",
+                    },
+                },
+                "required": [],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_get_booking",
+            "description": "Get details of a specific booking by UID",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "booking_uid": {
+                        "type": "string",
+                        "description": "The booking UID",
+                    },
+                },
+                "required": ["booking_uid"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_cancel_booking",
+            "description": "Cancel a booking/appointment",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "booking_uid": {
+                        "type": "string",
+                        "description": "The booking UID to cancel",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Reason for cancellation (sent to attendee)",
+                    },
+                },
+                "required": ["booking_uid"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "calcom_reschedule_booking",
+            "description": "Reschedule an existing booking to a new time",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "booking_uid": {
+                        "type": "string",
+                        "description": "The booking UID to reschedule",
+                    },
+                    "new_start_time": {
+                        "type": "string",
+                        "description": "New start time in ISO 8601 format",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Reason for rescheduling",
+                    },
+                },
+                "required": ["booking_uid", "new_start_time"],
+            },
+        },
+    },
+]
+
+
+def _tool_call(
+    event: str,
+    failure: str,
+) -> Callable[[Callable[P, Awaitable[dict[str, Any]]]], Callable[P, Awaitable[dict[str, Any]]]]:
+    """Decorator that turns errors raised by a Cal.com call into a failed tool result.
+
+    API error responses and transport errors are expected and only logged as
+    warnings; anything else is logged with a full traceback.
+
+    Args:
+        event: Log event name used when the wrapped call raises
+        failure: Error message prefix reported for API error responses
+    """
+
+    def decorator(
+        func: Callable[P, Awaitable[dict[str, Any]]],
+    ) -> Callable[P, Awaitable[dict[str, Any]]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> dict[str, Any]:
+            try:
+                return await func(*args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                logger.warning(
+                    event, status_code=e.response.status_code, error=e.response.text[:200]
+                )
+                return {"success": False, "error": f"{failure}: {e.response.text}"}
+            except httpx.RequestError as e:
+                logger.warning(event, error=str(e))
+                return {"success": False, "error": str(e)}
+            except Exception as e:
+                logger.exception(event, error=str(e))
+                return {"success": False, "error": str(e)}
+
+        return wrapper
+
+    return decorator
+
+
+def _copy_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached tool result so callers can't mutate the cached lists."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+
+# Process-wide clients keyed by API key so concurrent sessions share one pool
+_client_pool = SharedClientPool("calcom")
+
+# Availability lookups in flight across every session, keyed by
+# (api_key, event_type_id, start_date, end_date) so overlapping sessions for the
+# same account share one /slots/ request
+_inflight_availability: dict[tuple[str, int, str, str], asyncio.Task[dict[str, Any]]] = {}
+
 
 class CalComTools:
     """Cal.com API v2 integration tools.
@@ -24,6 +289,16 @@ class CalComTools:
     - Canceling/rescheduling bookings
     """
 
+    __slots__ = (
+        "_availability_cache",
+        "_client",
+        "_event_types_cache",
+        "_event_types_etag",
+        "_tool_map",
+        "api_key",
+        "event_type_id",
+    )
+
     BASE_URL = "https://api.cal.com/v2"
     API_VERSION = "2024-08-13"  # Cal.com API version header
 
@@ -37,237 +312,131 @@ class CalComTools:
         self.api_key = api_key
         self._client: httpx.AsyncClient | None = None
         self.event_type_id = event_type_id
+        self._event_types_cache: tuple[float, dict[str, Any]] | None = None
+        self._event_types_etag: str | None = None
+        self._availability_cache: dict[tuple[int, str, str], tuple[float, dict[str, Any]]] = {}
+        self._tool_map: dict[str, ToolHandler] = {
+            "calcom_get_event_types": self.get_event_types,
+            "calcom_get_availability": self.get_availability,
+            "calcom_create_booking": self.create_booking,
+            "calcom_list_bookings": self.list_bookings,
+            "calcom_get_booking": self.get_booking,
+            "calcom_cancel_booking": self.cancel_booking,
+            "calcom_reschedule_booking": self.reschedule_booking,
+        }
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client authenticated with this instance's API key."""
+        return httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "cal-api-version": self.API_VERSION,
+            },
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=CLIENT_LIMITS, retries=CONNECT_RETRIES
+            ),
+        )
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "cal-api-version": self.API_VERSION,
-                },
-                timeout=30.0,
-            )
+        """Get the shared HTTP client for this API key, creating it on first use."""
+        self._client = _client_pool.acquire(self.api_key, self._client, self._build_client)
         return self._client
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the shared HTTP client, closing it once no instance uses it."""
+        if self._client is None:
+            return
+
+        client, self._client = self._client, None
+        await _client_pool.release(self.api_key, client)
+
+    async def _request_idempotent(
+        self, method: str, url: str, *, client: httpx.AsyncClient | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a GET/DELETE request, retrying rate limits and gateway errors with backoff.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the Cal.com base URL
+            client: Client to send on; defaults to this instance's shared client
+            **kwargs: Passed through to httpx
+        """
+        client = client or self.client
+        for attempt in range(IDEMPOTENT_RETRIES):
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            logger.warning(
+                "calcom_request_retry",
+                method=method,
+                url=url,
+                status_code=response.status_code,
+                attempt=attempt + 1,
+            )
+            await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        return await client.request(method, url, **kwargs)
+
+    async def warmup(self) -> None:
+        """Open the connection to Cal.com before the first tool call needs it."""
+        with contextlib.suppress(httpx.HTTPError):
+            await self.client.head("/event-types")
 
     @staticmethod
     def get_tool_definitions() -> list[dict[str, Any]]:
         """Get OpenAI function calling tool definitions."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_get_event_types",
-                    "description": "Get available event types (meeting types) that can be scheduled on Cal.com",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_get_availability",
-                    "description": "Get available time slots for booking on a specific date range",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "event_type_id": {
-                                "type": "integer",
-                                "description": "The event type ID (from calcom_get_event_types)",
-                            },
-                            "start_date": {
-                                "type": "string",
-                                "description": "Start date for availability check (YYYY-MM-DD format)",
-                            },
-                            "end_date": {
-                                "type": "string",
-                                "description": "End date for availability check (YYYY-MM-DD format)",
-                            },
-                        },
-                        "required": ["event_type_id", "start_date", "end_date"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_create_booking",
-                    "description": "Create a booking/appointment directly on Cal.com. Unlike Calendly, Cal.com supports direct booking without requiring the customer to click a link.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "event_type_id": {
-                                "type": "integer",
-                                "description": "The event type ID to book",
-                            },
-                            "start_time": {
-                                "type": "string",
-                                "description": "Start time in ISO 8601 format (e.g., '2024-01-20T10:00:00Z')",
-                            },
-                            "attendee_email": {
-                                "type": "string",
-                                "description": "Email of the person booking the appointment",
-                            },
-                            "attendee_name": {
-                                "type": "string",
-                                "description": "Full name of the person booking",
-                            },
-                            "attendee_timezone": {
-                                "type": "string",
-                                "description": "Attendee's timezone (e.g., 'America/New_York', 'UTC')",
-                            },
-                            "notes": {
-                                "type": "string",
-                                "description": "Additional notes or special requests for the booking",
-                            },
-                        },
-                        "required": [
-                            "event_type_id",
-                            "start_time",
-                            "attendee_email",
-                            "attendee_name",
-                        ],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_list_bookings",
-                    "description": "List bookings/appointments, optionally filtered by date range or status",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "status": {
-                                "type": "string",
-                                "enum": ["upcoming", "past", "cancelled"],
-                                "description": "Filter bookings by status",
-                            },
-                            "after_start": {
-                                "type": "string",
-                                "description": "Filter bookings starting after this date (ISO 8601)",
-                            },
-                            "before_start": {
-                                "type": "string",
-                                "description": "Filter bookings starting before this date (ISO 8601)",
-                            },
-                            "attendee_email": {
-                                "type": "string",
-                                "description": "Filter bookings by attendee email",
-                            },
-                        },
-                        "required": [],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_get_booking",
-                    "description": "Get details of a specific booking by UID",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "booking_uid": {
-                                "type": "string",
-                                "description": "The booking UID",
-                            },
-                        },
-                        "required": ["booking_uid"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_cancel_booking",
-                    "description": "Cancel a booking/appointment",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "booking_uid": {
-                                "type": "string",
-                                "description": "The booking UID to cancel",
-                            },
-                            "reason": {
-                                "type": "string",
-                                "description": "Reason for cancellation (sent to attendee)",
-                            },
-                        },
-                        "required": ["booking_uid"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "calcom_reschedule_booking",
-                    "description": "Reschedule an existing booking to a new time",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "booking_uid": {
-                                "type": "string",
-                                "description": "The booking UID to reschedule",
-                            },
-                            "new_start_time": {
-                                "type": "string",
-                                "description": "New start time in ISO 8601 format",
-                            },
-                            "reason": {
-                                "type": "string",
-                                "description": "Reason for rescheduling",
-                            },
-                        },
-                        "required": ["booking_uid", "new_start_time"],
-                    },
-                },
-            },
-        ]
+        return list(_TOOL_DEFINITIONS)
 
+    @_tool_call("calcom_get_event_types_error", "Failed to get event types")
     async def get_event_types(self) -> dict[str, Any]:
-        """Get available event types."""
-        try:
-            response = await self.client.get("/event-types")
+        """Get available event types.
 
-            if response.status_code != HTTPStatus.OK:
-                return {
-                    "success": False,
-                    "error": f"Failed to get event types: {response.text}",
-                }
+        Results are cached for a short TTL. Once expired, the cached copy is
+        revalidated with the stored ETag so an unchanged list costs a 304.
+        """
+        headers: dict[str, str] = {}
+        if self._event_types_cache is not None:
+            cached_at, cached = self._event_types_cache
+            if time.monotonic() - cached_at < EVENT_TYPES_CACHE_TTL_SECONDS:
+                return _copy_result(cached)
+            if self._event_types_etag:
+                headers["If-None-Match"] = self._event_types_etag
 
-            data = response.json()
-            event_types = []
+        response = await self._request_idempotent("GET", "/event-types", headers=headers)
 
-            # Cal.com v2 API returns event types in 'data' field
-            for et in data.get("data", []):
-                event_types.append(
-                    {
-                        "id": et["id"],
-                        "title": et.get("title", et.get("slug")),
-                        "slug": et["slug"],
-                        "length": et.get("lengthInMinutes", et.get("length")),
-                        "description": et.get("description"),
-                    }
-                )
+        if response.status_code == HTTPStatus.NOT_MODIFIED and self._event_types_cache:
+            cached = self._event_types_cache[1]
+            self._event_types_cache = (time.monotonic(), cached)
+            return _copy_result(cached)
 
-            return {"success": True, "event_types": event_types}
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            self._event_types_cache = None
+            self._event_types_etag = None
+            raise
+
+        data = orjson.loads(response.content)
+
+        # Cal.com v2 API returns event types in 'data' field
+        event_types = [
+            {
+                "id": et["id"],
+                "title": et.get("title", et.get("slug")),
+                "slug": et["slug"],
+                "length": et.get("lengthInMinutes", et.get("length")),
+                "description": et.get("description"),
+            }
+            for et in data.get("data", [])
+        ]
 
-        except Exception as e:
-            logger.exception("calcom_get_event_types_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        result = {"success": True, "event_types": event_types}
+        self._event_types_cache = (time.monotonic(), result)
+        self._event_types_etag = response.headers.get("ETag")
+        return _copy_result(result)
 
     async def get_availability(
         self, event_type_id: int, start_date: str, end_date: str
@@ -279,42 +448,89 @@ class CalComTools:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
         """
+        cache_key = (event_type_id, start_date, end_date)
+        cached_entry = self._availability_cache.get(cache_key)
+        if cached_entry is not None:
+            cached_at, cached = cached_entry
+            if time.monotonic() - cached_at < AVAILABILITY_CACHE_TTL_SECONDS:
+                return _copy_result(cached)
+
+        # Concurrent callers asking for the same window share one request
+        inflight_key = (self.api_key, *cache_key)
+        task = _inflight_availability.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_availability(*cache_key))
+            _inflight_availability[inflight_key] = task
+            task.add_done_callback(lambda _task: _inflight_availability.pop(inflight_key, None))
+
+        # Shield so one cancelled caller doesn't cancel the request for the others.
+        # Every caller gets its own copy since the result is also cached
+        return _copy_result(await asyncio.shield(task))
+
+    @_tool_call("calcom_get_availability_error", "Failed to get availability")
+    async def _fetch_availability(
+        self, event_type_id: int, start_date: str, end_date: str
+    ) -> dict[str, Any]:
+        """Fetch available time slots from Cal.com and cache the result.
+
+        Runs as the shared in-flight task that sessions on the same account may
+        be awaiting, so it holds its own client reference instead of relying on
+        the session that started it staying open.
+        """
+        client = _client_pool.acquire(self.api_key, None, self._build_client)
         try:
-            # Cal.com v2 API uses /slots endpoint with query params
-            params: dict[str, str | int] = {
-                "eventTypeId": event_type_id,
-                "start": f"{start_date}T00:00:00Z",
-                "end": f"{end_date}T23:59:59Z",
-            }
+            return await self._fetch_slots(client, event_type_id, start_date, end_date)
+        finally:
+            await _client_pool.release(self.api_key, client)
 
-            response = await self.client.get("/slots/", params=params)
+    async def _fetch_slots(
+        self, client: httpx.AsyncClient, event_type_id: int, start_date: str, end_date: str
+    ) -> dict[str, Any]:
+        """Request slots and slot durations for _fetch_availability()."""
+        cache_key = (event_type_id, start_date, end_date)
+
+        # Cal.com v2 API uses /slots endpoint with query params
+        params: dict[str, str | int] = {
+            "eventTypeId": event_type_id,
+            "start": f"{start_date}T00:00:00Z",
+            "end": f"{end_date}T23:59:59Z",
+        }
 
-            if response.status_code != HTTPStatus.OK:
-                return {
-                    "success": False,
-                    "error": f"Failed to get availability: {response.text}",
-                }
+        # Slot durations come from the (usually cached) event type list
+        response, event_types = await asyncio.gather(
+            self._request_idempotent("GET", "/slots/", client=client, params=params),
+            self.get_event_types(),
+        )
 
-            data = response.json()
-            slots = []
+        response.raise_for_status()
 
-            # Cal.com returns slots grouped by date
-            slots_data = data.get("data", {}).get("slots", {})
-            for _date_key, date_slots in slots_data.items():
-                for slot in date_slots:
-                    slots.append(
-                        {
-                            "start_time": slot["time"],
-                            "duration_minutes": event_type_id,  # Get from event type
-                        }
-                    )
+        # Slots are still worth returning without durations, but say why they're missing
+        if not event_types.get("success"):
+            logger.warning(
+                "calcom_availability_missing_durations",
+                event_type_id=event_type_id,
+                error=event_types.get("error"),
+            )
 
-            return {"success": True, "available_slots": slots, "total": len(slots)}
+        durations = {et["id"]: et["length"] for et in event_types.get("event_types", [])}
+        duration_minutes = durations.get(event_type_id)
+
+        # Cal.com returns slots grouped by date; flatten them in a single pass
+        slots_by_date = orjson.loads(response.content).get("data", {}).get("slots", {})
+        slots = [
+            {
+                "start_time": slot["time"],
+                "duration_minutes": duration_minutes,
+            }
+            for date_slots in slots_by_date.values()
+            for slot in date_slots
+        ]
 
-        except Exception as e:
-            logger.exception("calcom_get_availability_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        result = {"success": True, "available_slots": slots, "total": len(slots)}
+        self._availability_cache[cache_key] = (time.monotonic(), result)
+        return result
 
+    @_tool_call("calcom_create_booking_error", "Failed to create booking")
     async def create_booking(
         self,
         event_type_id: int,
@@ -334,50 +550,45 @@ class CalComTools:
             attendee_timezone: Attendee timezone (default: UTC)
             notes: Optional notes
         """
-        try:
-            # Payload structure matching working implementations from livekit/agents and agno-agi
-            payload: dict[str, Any] = {
-                "start": start_time,  # ISO 8601 format in UTC
-                "eventTypeId": event_type_id,
-                "attendee": {
-                    "name": attendee_name,
-                    "email": attendee_email,
-                    "timeZone": attendee_timezone,
-                },
-            }
-
-            if notes:
-                payload["metadata"] = {"notes": notes}
-
-            response = await self.client.post("/bookings", json=payload)
-
-            if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
-                return {
-                    "success": False,
-                    "error": f"Failed to create booking: {response.text}",
-                }
-
-            booking = response.json().get("data", {})
-
-            return {
-                "success": True,
-                "message": f"Booking created successfully for {attendee_name}",
-                "booking": {
-                    "uid": booking.get("uid"),
-                    "id": booking.get("id"),
-                    "title": booking.get("title"),
-                    "start_time": booking.get("startTime"),
-                    "end_time": booking.get("endTime"),
-                    "attendee_email": attendee_email,
-                    "attendee_name": attendee_name,
-                    "status": booking.get("status"),
-                },
-            }
+        # Payload structure matching working implementations from livekit/agents and agno-agi
+        payload: dict[str, Any] = {
+            "start": start_time,  # ISO 8601 format in UTC
+            "eventTypeId": event_type_id,
+            "attendee": {
+                "name": attendee_name,
+                "email": attendee_email,
+                "timeZone": attendee_timezone,
+            },
+        }
 
-        except Exception as e:
-            logger.exception("calcom_create_booking_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        if notes:
+            payload["metadata"] = {"notes": notes}
+
+        # Encode with orjson; the client already sends Content-Type: application/json
+        response = await self.client.post("/bookings", content=orjson.dumps(payload))
+
+        response.raise_for_status()
+
+        # The booked slot is no longer available
+        self._availability_cache.clear()
+        booking = orjson.loads(response.content).get("data", {})
+
+        return {
+            "success": True,
+            "message": f"Booking created successfully for {attendee_name}",
+            "booking": {
+                "uid": booking.get("uid"),
+                "id": booking.get("id"),
+                "title": booking.get("title"),
+                "start_time": booking.get("startTime"),
+                "end_time": booking.get("endTime"),
+                "attendee_email": attendee_email,
+                "attendee_name": attendee_name,
+                "status": booking.get("status"),
+            },
+        }
 
+    @_tool_call("calcom_list_bookings_error", "Failed to list bookings")
     async def list_bookings(
         self,
         status: str | None = None,
@@ -386,173 +597,136 @@ class CalComTools:
         attendee_email: str | None = None,
     ) -> dict[str, Any]:
         """List bookings."""
-        try:
-            params: dict[str, Any] = {}
-
-            if status:
-                params["status"] = status
-            if after_start:
-                params["afterStart"] = after_start
-            if before_start:
-                params["beforeStart"] = before_start
-            if attendee_email:
-                params["attendeeEmail"] = attendee_email
-
-            response = await self.client.get("/bookings", params=params)
-
-            if response.status_code != HTTPStatus.OK:
-                return {
-                    "success": False,
-                    "error": f"Failed to list bookings: {response.text}",
-                }
-
-            data = response.json()
-            bookings = []
-
-            for booking in data.get("data", []):
-                bookings.append(
-                    {
-                        "uid": booking.get("uid"),
-                        "id": booking.get("id"),
-                        "title": booking.get("title"),
-                        "start_time": booking.get("startTime"),
-                        "end_time": booking.get("endTime"),
-                        "status": booking.get("status"),
-                        "attendees": [
-                            {
-                                "name": att.get("name"),
-                                "email": att.get("email"),
-                            }
-                            for att in booking.get("attendees", [])
-                        ],
-                    }
-                )
+        params: dict[str, Any] = {}
 
-            return {"success": True, "bookings": bookings, "total": len(bookings)}
+        if status:
+            params["status"] = status
+        if after_start:
+            params["afterStart"] = after_start
+        if before_start:
+            params["beforeStart"] = before_start
+        if attendee_email:
+            params["attendeeEmail"] = attendee_email
 
-        except Exception as e:
-            logger.exception("calcom_list_bookings_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        response = await self._request_idempotent("GET", "/bookings", params=params)
 
-    async def get_booking(self, booking_uid: str) -> dict[str, Any]:
-        """Get details of a specific booking."""
-        try:
-            response = await self.client.get(f"/bookings/{booking_uid}")
-
-            if response.status_code != HTTPStatus.OK:
-                return {
-                    "success": False,
-                    "error": f"Failed to get booking: {response.text}",
-                }
-
-            booking = response.json().get("data", {})
-
-            return {
-                "success": True,
-                "booking": {
-                    "uid": booking.get("uid"),
-                    "id": booking.get("id"),
-                    "title": booking.get("title"),
-                    "description": booking.get("description"),
-                    "start_time": booking.get("startTime"),
-                    "end_time": booking.get("endTime"),
-                    "status": booking.get("status"),
-                    "attendees": [
-                        {
-                            "name": att.get("name"),
-                            "email": att.get("email"),
-                            "timezone": att.get("timeZone"),
-                        }
-                        for att in booking.get("attendees", [])
-                    ],
-                    "location": booking.get("location"),
-                    "metadata": booking.get("metadata"),
-                },
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        bookings = [
+            {
+                "uid": booking.get("uid"),
+                "id": booking.get("id"),
+                "title": booking.get("title"),
+                "start_time": booking.get("startTime"),
+                "end_time": booking.get("endTime"),
+                "status": booking.get("status"),
+                "attendees": [
+                    {"name": att.get("name"), "email": att.get("email")}
+                    for att in booking.get("attendees", [])
+                ],
             }
+            for booking in data.get("data", [])
+        ]
 
-        except Exception as e:
-            logger.exception("calcom_get_booking_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        return {"success": True, "bookings": bookings, "total": len(bookings)}
 
+    @_tool_call("calcom_get_booking_error", "Failed to get booking")
+    async def get_booking(self, booking_uid: str) -> dict[str, Any]:
+        """Get details of a specific booking."""
+        response = await self._request_idempotent("GET", f"/bookings/{booking_uid}")
+
+        response.raise_for_status()
+
+        booking = orjson.loads(response.content).get("data", {})
+
+        return {
+            "success": True,
+            "booking": {
+                "uid": booking.get("uid"),
+                "id": booking.get("id"),
+                "title": booking.get("title"),
+                "description": booking.get("description"),
+                "start_time": booking.get("startTime"),
+                "end_time": booking.get("endTime"),
+                "status": booking.get("status"),
+                "attendees": [
+                    {
+                        "name": att.get("name"),
+                        "email": att.get("email"),
+                        "timezone": att.get("timeZone"),
+                    }
+                    for att in booking.get("attendees", [])
+                ],
+                "location": booking.get("location"),
+                "metadata": booking.get("metadata"),
+            },
+        }
+
+    @_tool_call("calcom_cancel_booking_error", "Failed to cancel booking")
     async def cancel_booking(self, booking_uid: str, reason: str | None = None) -> dict[str, Any]:
         """Cancel a booking."""
-        try:
-            # Cal.com API accepts cancellation reason as query param or in request body via POST
-            # Using query params for simplicity
-            params: dict[str, str] = {}
-            if reason:
-                params["cancellationReason"] = reason
-
-            response = await self.client.delete(f"/bookings/{booking_uid}", params=params)
-
-            if response.status_code not in (HTTPStatus.OK, HTTPStatus.NO_CONTENT):
-                return {
-                    "success": False,
-                    "error": f"Failed to cancel booking: {response.text}",
-                }
-
-            return {
-                "success": True,
-                "message": f"Booking {booking_uid} has been canceled",
-                "reason": reason,
-            }
-
-        except Exception as e:
-            logger.exception("calcom_cancel_booking_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        # Cal.com API accepts cancellation reason as query param or in request body via POST
+        # Using query params for simplicity
+        params: dict[str, str] = {}
+        if reason:
+            params["cancellationReason"] = reason
+
+        response = await self._request_idempotent(
+            "DELETE", f"/bookings/{booking_uid}", params=params
+        )
+
+        response.raise_for_status()
+
+        self._availability_cache.clear()
+        return {
+            "success": True,
+            "message": f"Booking {booking_uid} has been canceled",
+            "reason": reason,
+        }
 
+    @_tool_call("calcom_reschedule_booking_error", "Failed to reschedule booking")
     async def reschedule_booking(
         self, booking_uid: str, new_start_time: str, reason: str | None = None
     ) -> dict[str, Any]:
         """Reschedule a booking to a new time."""
-        try:
-            payload: dict[str, Any] = {
-                "start": new_start_time,
-            }
+        payload: dict[str, Any] = {
+            "start": new_start_time,
+        }
 
-            if reason:
-                payload["reschedulingReason"] = reason
+        if reason:
+            payload["reschedulingReason"] = reason
 
-            # Cal.com uses PATCH for rescheduling
-            response = await self.client.patch(f"/bookings/{booking_uid}/reschedule", json=payload)
+        # Cal.com uses PATCH for rescheduling
+        response = await self.client.patch(
+            f"/bookings/{booking_uid}/reschedule", content=orjson.dumps(payload)
+        )
 
-            if response.status_code != HTTPStatus.OK:
-                return {
-                    "success": False,
-                    "error": f"Failed to reschedule booking: {response.text}",
-                }
+        response.raise_for_status()
 
-            booking = response.json().get("data", {})
+        self._availability_cache.clear()
+        booking = orjson.loads(response.content).get("data", {})
 
-            return {
-                "success": True,
-                "message": f"Booking {booking_uid} has been rescheduled",
-                "booking": {
-                    "uid": booking.get("uid"),
-                    "new_start_time": booking.get("startTime"),
-                    "new_end_time": booking.get("endTime"),
-                },
-            }
-
-        except Exception as e:
-            logger.exception("calcom_reschedule_booking_error", error=str(e))
-            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "message": f"Booking {booking_uid} has been rescheduled",
+            "booking": {
+                "uid": booking.get("uid"),
+                "new_start_time": booking.get("startTime"),
+                "new_end_time": booking.get("endTime"),
+            },
+        }
 
     async def execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a Cal.com tool by name."""
-        tool_map: dict[str, ToolHandler] = {
-            "calcom_get_event_types": self.get_event_types,
-            "calcom_get_availability": self.get_availability,
-            "calcom_create_booking": self.create_booking,
-            "calcom_list_bookings": self.list_bookings,
-            "calcom_get_booking": self.get_booking,
-            "calcom_cancel_booking": self.cancel_booking,
-            "calcom_reschedule_booking": self.reschedule_booking,
-        }
-
-        handler = tool_map.get(tool_name)
+        handler = self._tool_map.get(tool_name)
         if not handler:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
         result: dict[str, Any] = await handler(**arguments)
         return result
+
+
+async def close_shared_clients() -> None:
+    """Close every shared Cal.com HTTP client (called on application shutdown)."""
+    await _client_pool.close_all()
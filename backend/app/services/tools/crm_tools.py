@@ -1,24 +1,428 @@
 """CRM tools for voice agents - bookings, contacts, appointments."""
 
+import asyncio
+import logging
 import re
+import time
 import uuid
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
+from zoneinfo import ZoneInfo
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, DateTime, Select, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import load_only, raiseload, undefer
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.api.integrations import get_workspace_integrations
 from app.core.auth import user_id_to_uuid
-from app.core.cache import cache_invalidate
+from app.core.cache import (
+    cache_delete,
+    cache_get,
+    cache_invalidate_index,
+    cache_set,
+    cache_set_indexed,
+)
 from app.models.appointment import Appointment
 from app.models.calendar_sync import CalendarSyncQueue
 from app.models.contact import Contact
+from app.models.workspace import Workspace
 
 logger = structlog.get_logger()
 
+ToolHandler = Callable[..., Awaitable[dict[str, Any]]]
+
+# External calendars that appointments are synced to, in enqueue order
+CALENDAR_PROVIDERS = ("cal-com", "calendly", "gohighlevel", "google-calendar")
+
+# Patterns used by parse_date (e.g. "9am", "2:30 pm", "14:00" and "2025-01-20")
+TIME_PATTERN = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?")
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+WORD_PATTERN = re.compile(r"[a-z0-9:\-]+")
+
+# search_customer queries made only of digits and phone punctuation, e.g. "(555) 123-4567"
+PHONE_QUERY_PATTERN = re.compile(r"\+?[\d\s().-]*\d[\d\s().-]*")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# Maximum number of contacts returned by search_customer
+SEARCH_RESULT_LIMIT = 3
+
+# Default cap on rows returned by list_appointments
+APPOINTMENT_LIST_LIMIT = 100
+
+# Hourly availability slots (9 AM to 5 PM) and their ISO time suffixes
+SLOT_HOURS = tuple(range(9, 17))
+SLOT_SUFFIXES = tuple(f"T{hour:02d}:00:00" for hour in SLOT_HOURS)
+
+# Workspace timezones are cached in Redis across sessions; updating a
+# workspace's settings deletes the entry
+WORKSPACE_TIMEZONE_CACHE_TTL_SECONDS = 3600
+CALENDAR_PROVIDERS_CACHE_TTL_SECONDS = 60
+
+# English month names for spoken appointment times, indexed by month - 1
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Day names understood by parse_date, mapped to datetime.weekday() values
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+# Relative day words understood by parse_date, mapped to their offset from today
+RELATIVE_DAYS = {"tomorrow": 1, "today": 0}
+
+
+@lru_cache(maxsize=64)
+def get_zoneinfo(name: str) -> ZoneInfo:
+    """Get a ZoneInfo by IANA name, memoized for repeated per-call lookups.
+
+    Args:
+        name: IANA timezone name (e.g. "America/New_York")
+
+    Returns:
+        The matching timezone
+
+    Raises:
+        ZoneInfoNotFoundError: If no timezone exists with that name
+    """
+    return ZoneInfo(name)
+
+
+class UtcTimestamp(FunctionElement[datetime]):
+    """A timestamptz as UTC wall-clock time, whatever the session's TimeZone.
+
+    EXTRACT on a timestamptz uses the session TimeZone, so hours read from
+    Postgres would shift on servers not set to UTC. SQLite has no time zones
+    and stores the values as written, so elsewhere this is the bare column.
+    """
+
+    type = DateTime()
+    name = "utc_timestamp"
+    inherit_cache = True
+
+
+@compiles(UtcTimestamp)
+def _compile_utc_timestamp(element: UtcTimestamp, compiler: SQLCompiler, **kw: Any) -> str:
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(UtcTimestamp, "postgresql")
+def _compile_utc_timestamp_postgresql(
+    element: UtcTimestamp, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return compiler.process(func.timezone("UTC", *element.clauses), **kw)
+
+
+def elapsed_ms(start: float) -> float:
+    """Get milliseconds elapsed since a time.perf_counter() reading, for logging.
+
+    Args:
+        start: Earlier time.perf_counter() value
+
+    Returns:
+        Elapsed time in milliseconds, rounded to two decimals
+    """
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date into a naive midnight datetime.
+
+    fromisoformat is implemented in C and many times faster than strptime, so
+    zero-padded dates take that path; the shape check keeps the other ISO forms
+    it accepts (times, week dates) out of tool input. Unpadded dates such as
+    "2025-1-5", which models produce too, fall back to strptime.
+
+    Args:
+        value: Date string in YYYY-MM-DD format
+
+    Returns:
+        Datetime at midnight of that date
+
+    Raises:
+        ValueError: If the value is not a YYYY-MM-DD date
+    """
+    if len(value) == len("YYYY-MM-DD") and value[4] == "-" and value[7] == "-":
+        return datetime.fromisoformat(value)
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD") from None
+
+
+@lru_cache(maxsize=1024)
+def resolve_date_expression(text: str, today: date) -> tuple[date, int, int]:
+    """Resolve a normalized date expression to a calendar date and time of day.
+
+    Pure and memoized on (text, today), so agents repeating a phrase such as
+    "tomorrow at 3pm" within a day skip re-parsing it.
+
+    Args:
+        text: Lowercased, stripped expression like "next friday at 2:30pm"
+        today: Current date in the workspace timezone
+
+    Returns:
+        Tuple of (date, hour, minute); the time defaults to 9:00
+    """
+    # Parse time (e.g., "9am", "2pm", "14:00", "9:30am"), skipping any ISO date
+    # so its digits aren't read as the hour
+    date_match = ISO_DATE_PATTERN.search(text)
+    time_text = f"{text[: date_match.start()]} {text[date_match.end() :]}" if date_match else text
+    time_match = TIME_PATTERN.search(time_text)
+    hour = 9  # default
+    minute = 0
+
+    if time_match:
+        hour = int(time_match.group(1))
+        minute = int(time_match.group(2)) if time_match.group(2) else 0
+        am_pm = time_match.group(3)
+
+        # Convert 12-hour to 24-hour
+        if am_pm:
+            if am_pm == "pm" and hour != 12:  # noqa: PLR2004
+                hour += 12
+            elif am_pm == "am" and hour == 12:  # noqa: PLR2004
+                hour = 0
+
+    # Parse date
+    target_date = today
+
+    # Day names resolve to their next occurrence; "next" adds another week
+    words = WORD_PATTERN.findall(text)
+    target_day = next((WEEKDAYS[word] for word in words if word in WEEKDAYS), None)
+    offset = next((RELATIVE_DAYS[word] for word in words if word in RELATIVE_DAYS), None)
+    if target_day is not None:
+        days_ahead = target_day - today.weekday()
+        if days_ahead <= 0:  # Target day already happened this week
+            days_ahead += 7
+        if "next" in words and days_ahead < 7:  # noqa: PLR2004
+            days_ahead += 7
+        target_date = today + timedelta(days=days_ahead)
+    elif offset is not None:
+        target_date = today + timedelta(days=offset)
+    elif date_match:
+        target_date = parse_ymd(date_match.group(0)).date()
+
+    return target_date, hour, minute
+
+
+def format_appointment_time(dt: datetime) -> str:
+    """Format an appointment time for tool messages, e.g. "January 05 at 02:30 PM".
+
+    Equivalent to strftime("%B %d at %I:%M %p") in the C locale, but built
+    directly from the datetime fields to skip strftime's locale handling.
+
+    Args:
+        dt: Appointment datetime
+
+    Returns:
+        Human-readable month, day and 12-hour time
+    """
+    is_pm, hour = divmod(dt.hour, 12)
+    meridiem = "PM" if is_pm else "AM"
+    return (
+        f"{MONTH_NAMES[dt.month - 1]} {dt.day:02d} at {hour or 12:02d}:{dt.minute:02d} {meridiem}"
+    )
+
+
+# OpenAI function calling tool definitions, built once at import time.
+# Shared by every session, so callers must treat the dicts as read-only.
+_TOOL_DEFINITIONS: tuple[dict[str, Any], ...] = (
+    {
+        "type": "function",
+        "name": "search_customer",
+        "description": "Search for a customer by phone number, email, or name",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Phone number, email, or name to search for",
+                },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "create_contact",
+        "description": "Create a new contact/customer in the CRM. REQUIRED: first_name and phone_number. OPTIONAL: last_name, email, company_name. Do NOT ask for optional fields unless the customer volunteers the information.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "first_name": {
+                    "type": "string",
+                    "description": "REQUIRED. Customer's first name. Cannot be empty.",
+                },
+                "phone_number": {
+                    "type": "string",
+                    "description": "REQUIRED. Customer's phone number (7-20 digits). Format: digits only or E.164 format.",
+                },
+                "last_name": {
+                    "type": "string",
+                    "description": "OPTIONAL. Customer's last name. Only collect if volunteered.",
+                },
+                "email": {
+                    "type": "string",
+                    "description": "OPTIONAL. Customer's email address. Only collect if volunteered.",
+                },
+                "company_name": {
+                    "type": "string",
+                    "description": "OPTIONAL. Company or organization name. Only collect if volunteered.",
+                },
+            },
+            "required": ["first_name", "phone_number"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "check_availability",
+        "description": "Check available appointment time slots for a specific date",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "description": "Date to check in YYYY-MM-DD format",
+                },
+                "duration_minutes": {
+                    "type": "integer",
+                    "description": "Desired appointment duration in minutes (default 30)",
+                },
+            },
+            "required": ["date"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "parse_date",
+        "description": "Convert natural language date/time (like 'Tuesday at 9am', 'next Thursday 2pm', 'tomorrow at 3') into proper ISO 8601 format for booking. Use this BEFORE booking if you have ambiguous dates.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "date_expression": {
+                    "type": "string",
+                    "description": "Natural language date/time like 'Tuesday at 9am', 'next week', 'tomorrow 2pm'",
+                },
+            },
+            "required": ["date_expression"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "book_appointment",
+        "description": "Book an appointment for a customer",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "contact_phone": {
+                    "type": "string",
+                    "description": "Customer's phone number",
+                },
+                "scheduled_at": {
+                    "type": "string",
+                    "description": "Appointment date and time in ISO 8601 format (YYYY-MM-DDTHH:MM:SS)",
+                },
+                "duration_minutes": {
+                    "type": "integer",
+                    "description": "Duration in minutes (default 30)",
+                },
+                "service_type": {
+                    "type": "string",
+                    "description": "Type of service/appointment",
+                },
+                "notes": {"type": "string", "description": "Additional notes"},
+            },
+            "required": ["contact_phone", "scheduled_at"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "list_appointments",
+        "description": "List upcoming appointments, optionally filtered by date or contact",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "contact_phone": {
+                    "type": "string",
+                    "description": "Filter by customer phone number",
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date in YYYY-MM-DD format",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date in YYYY-MM-DD format",
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Filter by status (scheduled, completed, cancelled, no_show)",
+                },
+            },
+            "required": [],
+        },
+    },
+    {
+        "type": "function",
+        "name": "cancel_appointment",
+        "description": "Cancel an existing appointment",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "appointment_id": {
+                    "type": "integer",
+                    "description": "Appointment ID to cancel",
+                },
+                "reason": {"type": "string", "description": "Cancellation reason"},
+            },
+            "required": ["appointment_id"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "reschedule_appointment",
+        "description": "Reschedule an existing appointment to a new time",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "appointment_id": {
+                    "type": "integer",
+                    "description": "Appointment ID to reschedule",
+                },
+                "new_scheduled_at": {
+                    "type": "string",
+                    "description": "New appointment time in ISO 8601 format",
+                },
+            },
+            "required": ["appointment_id", "new_scheduled_at"],
+        },
+    },
+)
+
 
 class CRMTools:
     """Internal CRM tools for voice agents.
@@ -37,6 +441,7 @@ class CRMTools:
         db: AsyncSession,
         user_id: int,
         workspace_id: uuid.UUID | None = None,
+        integrations: dict[str, dict[str, Any]] | None = None,
     ) -> None:
         """Initialize CRM tools.
 
@@ -44,17 +449,105 @@ class CRMTools:
             db: Database session
             user_id: User ID (agent owner) - integer matching Contact.user_id
             workspace_id: Workspace UUID for scoping contacts
+            integrations: Already-fetched workspace integrations, reused when
+                enqueueing calendar syncs (fetched on first use if omitted)
         """
         self.db = db
         self.user_id = user_id
         self.workspace_id = workspace_id
+        self._integrations = integrations
         self.logger = logger.bind(
             component="crm_tools", user_id=user_id, workspace_id=str(workspace_id)
         )
+        self._workspace_timezone: str | None = None
+        self._workspace_timezone_loaded = False
+        # book_appointment is dispatched separately since it also takes agent_id
+        self._tool_map: dict[str, ToolHandler] = {
+            "search_customer": self.search_customer,
+            "create_contact": self.create_contact,
+            "check_availability": self.check_availability,
+            "list_appointments": self.list_appointments,
+            "cancel_appointment": self.cancel_appointment,
+            "reschedule_appointment": self.reschedule_appointment,
+            "parse_date": self.parse_date,
+        }
+
+    async def _get_workspace_timezone(self) -> str | None:
+        """Get the workspace's configured timezone name.
+
+        Loaded once per instance, since date parsing can run several times per
+        conversation and the setting does not change mid-session. The first
+        load per session is served from Redis when possible.
+
+        Returns:
+            IANA timezone name, or None if the workspace has none configured
+        """
+        if not self._workspace_timezone_loaded:
+            if self.workspace_id:
+                cache_key = f"workspace:timezone:{self.workspace_id}"
+                cached = await cache_get(cache_key)
+                if cached is not None:
+                    self._workspace_timezone = cached.get("timezone")
+                else:
+                    result = await self.db.execute(
+                        select(Workspace.settings).where(Workspace.id == self.workspace_id)
+                    )
+                    settings = result.scalar_one_or_none()
+                    self._workspace_timezone = settings.get("timezone") if settings else None
+                    await cache_set(
+                        cache_key,
+                        {"timezone": self._workspace_timezone},
+                        ttl=WORKSPACE_TIMEZONE_CACHE_TTL_SECONDS,
+                    )
+            self._workspace_timezone_loaded = True
+        return self._workspace_timezone
+
+    async def _get_calendar_providers(self, workspace_id: uuid.UUID) -> list[str]:
+        """Get the calendar providers connected for a workspace.
+
+        Reuses the session's integrations when they apply. Otherwise the provider
+        names (never credentials) are cached in Redis, so most bookings skip the
+        integrations query; the integrations API clears them on any change. The
+        query itself runs in a SAVEPOINT so sync stays best-effort.
+
+        Args:
+            workspace_id: Workspace the appointment belongs to
+
+        Returns:
+            Connected providers, in CALENDAR_PROVIDERS order
+        """
+        if self._integrations is not None and workspace_id == self.workspace_id:
+            return [p for p in CALENDAR_PROVIDERS if p in self._integrations]
+
+        user_uuid = user_id_to_uuid(self.user_id)
+        cache_key = f"integrations:calendar_providers:{user_uuid}:{workspace_id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Callers are mid-transaction with unsaved appointment changes; a failed
+        # query must roll back only this savepoint, not abort their transaction
+        async with self.db.begin_nested():
+            integrations = await get_workspace_integrations(
+                user_id=user_uuid, workspace_id=workspace_id, db=self.db
+            )
+        if workspace_id == self.workspace_id:
+            self._integrations = integrations
+        providers = [p for p in CALENDAR_PROVIDERS if p in integrations]
+        await cache_set_indexed(
+            cache_key,
+            providers,
+            f"integrations:calendar_providers:{user_uuid}:keys",
+            ttl=CALENDAR_PROVIDERS_CACHE_TTL_SECONDS,
+        )
+        return providers
 
     async def _enqueue_calendar_sync(self, appointment: Appointment, operation: str) -> None:
         """Enqueue appointment for sync to external calendars.
 
+        Sync entries join the caller's transaction; the caller commits them
+        together with the appointment change.
+
         Args:
             appointment: Appointment to sync
             operation: Sync operation (create, update, cancel)
@@ -64,58 +557,67 @@ class CRMTools:
             return
 
         try:
-            # Get workspace integrations
-            integrations = await get_workspace_integrations(
-                user_id=user_id_to_uuid(self.user_id),
-                workspace_id=appointment.workspace_id,
-                db=self.db,
-            )
+            providers = await self._get_calendar_providers(appointment.workspace_id)
+            if not providers:
+                return
+
+            # Queue inside a SAVEPOINT so a failure here rolls back only the sync
+            # entries, never the caller's appointment changes in the same transaction
+            async with self.db.begin_nested():
+                # DEDUPLICATION: Fetch providers that already have a pending sync in one query
+                existing = await self.db.execute(
+                    select(CalendarSyncQueue.calendar_provider).where(
+                        CalendarSyncQueue.appointment_id == appointment.id,
+                        CalendarSyncQueue.calendar_provider.in_(providers),
+                        CalendarSyncQueue.operation == operation,
+                        CalendarSyncQueue.status.in_(["pending", "processing"]),
+                    )
+                )
+                already_queued = set(existing.scalars())
+
+                payload = {
+                    "appointment_id": appointment.id,
+                    "scheduled_at": appointment.scheduled_at.isoformat(),
+                    "duration_minutes": appointment.duration_minutes,
+                    "service_type": appointment.service_type,
+                    "notes": appointment.notes,
+                }
+                log_debug = self.logger.is_enabled_for(logging.DEBUG)
+                log_info = self.logger.is_enabled_for(logging.INFO)
+                sync_entries = []
+                for provider in providers:
+                    if provider in already_queued:
+                        if log_debug:
+                            self.logger.debug(
+                                "sync_already_queued_skipping",
+                                appointment_id=appointment.id,
+                                provider=provider,
+                                operation=operation,
+                            )
+                        continue
 
-            # Queue sync for each connected calendar provider
-            for provider in ["cal-com", "calendly", "gohighlevel", "google-calendar"]:
-                if provider in integrations:
-                    # DEDUPLICATION: Check if pending sync already exists
-                    existing = await self.db.execute(
-                        select(CalendarSyncQueue).where(
-                            CalendarSyncQueue.appointment_id == appointment.id,
-                            CalendarSyncQueue.calendar_provider == provider,
-                            CalendarSyncQueue.operation == operation,
-                            CalendarSyncQueue.status.in_(["pending", "processing"]),
+                    sync_entries.append(
+                        CalendarSyncQueue(
+                            id=uuid.uuid4(),
+                            appointment_id=appointment.id,
+                            workspace_id=appointment.workspace_id,
+                            operation=operation,
+                            calendar_provider=provider,
+                            payload=dict(payload),
                         )
                     )
-                    if existing.scalar_one_or_none():
-                        self.logger.debug(
-                            "sync_already_queued_skipping",
+                    if log_info:
+                        self.logger.info(
+                            "calendar_sync_enqueued",
                             appointment_id=appointment.id,
                             provider=provider,
                             operation=operation,
                         )
-                        continue
-
-                    sync_entry = CalendarSyncQueue(
-                        id=uuid.uuid4(),
-                        appointment_id=appointment.id,
-                        workspace_id=appointment.workspace_id,
-                        operation=operation,
-                        calendar_provider=provider,
-                        payload={
-                            "appointment_id": appointment.id,
-                            "scheduled_at": appointment.scheduled_at.isoformat(),
-                            "duration_minutes": appointment.duration_minutes,
-                            "service_type": appointment.service_type,
-                            "notes": appointment.notes,
-                        },
-                    )
-                    self.db.add(sync_entry)
 
-                    self.logger.info(
-                        "calendar_sync_enqueued",
-                        appointment_id=appointment.id,
-                        provider=provider,
-                        operation=operation,
-                    )
+                if not sync_entries:
+                    return
 
-            await self.db.commit()
+                self.db.add_all(sync_entries)
         except Exception as e:
             self.logger.exception(
                 "failed_to_enqueue_calendar_sync",
@@ -124,6 +626,46 @@ class CRMTools:
             )
             # Don't raise - sync failure shouldn't block appointment creation
 
+    async def _invalidate_stats_cache(self, user_id: int, reason: str) -> None:
+        """Invalidate cached CRM stats, logging rather than raising on failure.
+
+        Stats are cached per contact owner, so this deletes a single key instead
+        of scanning the keyspace for every user's stats.
+
+        Args:
+            user_id: Owner of the contacts whose stats changed
+            reason: Why the cache is being invalidated (for logging)
+        """
+        log_debug = self.logger.is_enabled_for(logging.DEBUG)
+        cache_start = time.perf_counter()
+        cache_key = f"crm:stats:{user_id}"
+
+        try:
+            if log_debug:
+                self.logger.debug(
+                    "cache_invalidation_starting",
+                    cache_key=cache_key,
+                    reason=reason,
+                )
+
+            await cache_delete(cache_key)
+
+            if log_debug:
+                self.logger.debug(
+                    "cache_invalidation_success",
+                    cache_key=cache_key,
+                    duration_ms=elapsed_ms(cache_start),
+                )
+        except Exception as cache_error:
+            self.logger.exception(
+                "failed_to_invalidate_cache_after_book_appointment",
+                error=str(cache_error),
+                error_type=type(cache_error).__name__,
+                duration_ms=elapsed_ms(cache_start),
+                impact="cache_hit_may_return_stale_stats",
+            )
+            # Don't raise - cache failure shouldn't block appointment success
+
     @staticmethod
     def get_tool_definitions() -> list[dict[str, Any]]:
         """Get OpenAI function calling tool definitions.
@@ -131,178 +673,7 @@ class CRMTools:
         Returns:
             List of tool definitions for GPT Realtime API (uses nested function format)
         """
-        return [
-            {
-                "type": "function",
-                "name": "search_customer",
-                "description": "Search for a customer by phone number, email, or name",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Phone number, email, or name to search for",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "create_contact",
-                "description": "Create a new contact/customer in the CRM. REQUIRED: first_name and phone_number. OPTIONAL: last_name, email, company_name. Do NOT ask for optional fields unless the customer volunteers the information.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "first_name": {
-                            "type": "string",
-                            "description": "REQUIRED. Customer's first name. Cannot be empty.",
-                        },
-                        "phone_number": {
-                            "type": "string",
-                            "description": "REQUIRED. Customer's phone number (7-20 digits). Format: digits only or E.164 format.",
-                        },
-                        "last_name": {
-                            "type": "string",
-                            "description": "OPTIONAL. Customer's last name. Only collect if volunteered.",
-                        },
-                        "email": {
-                            "type": "string",
-                            "description": "OPTIONAL. Customer's email address. Only collect if volunteered.",
-                        },
-                        "company_name": {
-                            "type": "string",
-                            "description": "OPTIONAL. Company or organization name. Only collect if volunteered.",
-                        },
-                    },
-                    "required": ["first_name", "phone_number"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "check_availability",
-                "description": "Check available appointment time slots for a specific date",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "date": {
-                            "type": "string",
-                            "description": "Date to check in YYYY-MM-DD format",
-                        },
-                        "duration_minutes": {
-                            "type": "integer",
-                            "description": "Desired appointment duration in minutes (default 30)",
-                        },
-                    },
-                    "required": ["date"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "parse_date",
-                "description": "Convert natural language date/time (like 'Tuesday at 9am', 'next Thursday 2pm', 'tomorrow at 3') into proper ISO 8601 format for booking. Use this BEFORE booking if you have ambiguous dates.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "date_expression": {
-                            "type": "string",
-                            "description": "Natural language date/time like 'Tuesday at 9am', 'next week', 'tomorrow 2pm'",
-                        },
-                    },
-                    "required": ["date_expression"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "book_appointment",
-                "description": "Book an appointment for a customer",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "contact_phone": {
-                            "type": "string",
-                            "description": "Customer's phone number",
-                        },
-                        "scheduled_at": {
-                            "type": "string",
-                            "description": "Appointment date and time in ISO 8601 format (YYYY-MM-DDTHH:MM:SS)",
-                        },
-                        "duration_minutes": {
-                            "type": "integer",
-                            "description": "Duration in minutes (default 30)",
-                        },
-                        "service_type": {
-                            "type": "string",
-                            "description": "Type of service/appointment",
-                        },
-                        "notes": {"type": "string", "description": "Additional notes"},
-                    },
-                    "required": ["contact_phone", "scheduled_at"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "list_appointments",
-                "description": "List upcoming appointments, optionally filtered by date or contact",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "contact_phone": {
-                            "type": "string",
-                            "description": "Filter by customer phone number",
-                        },
-                        "start_date": {
-                            "type": "string",
-                            "description": "Start date in YYYY-MM-DD format",
-                        },
-                        "end_date": {
-                            "type": "string",
-                            "description": "End date in YYYY-MM-DD format",
-                        },
-                        "status": {
-                            "type": "string",
-                            "description": "Filter by status (scheduled, completed, cancelled, no_show)",
-                        },
-                    },
-                    "required": [],
-                },
-            },
-            {
-                "type": "function",
-                "name": "cancel_appointment",
-                "description": "Cancel an existing appointment",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "appointment_id": {
-                            "type": "integer",
-                            "description": "Appointment ID to cancel",
-                        },
-                        "reason": {"type": "string", "description": "Cancellation reason"},
-                    },
-                    "required": ["appointment_id"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "reschedule_appointment",
-                "description": "Reschedule an existing appointment to a new time",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "appointment_id": {
-                            "type": "integer",
-                            "description": "Appointment ID to reschedule",
-                        },
-                        "new_scheduled_at": {
-                            "type": "string",
-                            "description": "New appointment time in ISO 8601 format",
-                        },
-                    },
-                    "required": ["appointment_id", "new_scheduled_at"],
-                },
-            },
-        ]
+        return list(_TOOL_DEFINITIONS)
 
     async def search_customer(self, query: str) -> dict[str, Any]:
         """Search for a customer by phone, email, or name.
@@ -316,32 +687,57 @@ class CRMTools:
         try:
             # Search by phone, email, or name - filtered by workspace_id for proper scoping
             # Falls back to user_id if workspace_id not available (backward compatibility)
-            # Also search full name (first + last) for queries like "John Smith"
-            full_name = func.concat(Contact.first_name, " ", func.coalesce(Contact.last_name, ""))
-
-            # Build base query with search conditions
-            search_conditions = (
-                (Contact.phone_number.ilike(f"%{query}%"))
-                | (Contact.email.ilike(f"%{query}%"))
-                | (Contact.first_name.ilike(f"%{query}%"))
-                | (Contact.last_name.ilike(f"%{query}%"))
-                | (full_name.ilike(f"%{query}%"))
-            )
+            # Only the column the query can match is searched. Names and emails use
+            # prefix matches so indexes stay usable; phone numbers keep a substring
+            # match since callers often omit the country code
+            term = query.strip()
+            first_term, _, rest = term.partition(" ")
+            search_conditions: ColumnElement[bool]
+            if PHONE_QUERY_PATTERN.fullmatch(term):
+                digits = NON_DIGIT_PATTERN.sub("", term)
+                search_conditions = Contact.phone_number.ilike(f"%{digits}%")
+                if digits != term:
+                    search_conditions |= Contact.phone_number.ilike(f"%{term}%")
+            elif "@" in term:
+                search_conditions = Contact.email.ilike(f"{term}%")
+            elif rest:
+                # Full name queries like "John Smith"
+                search_conditions = Contact.first_name.ilike(f"{first_term}%") & (
+                    Contact.last_name.ilike(f"{rest.strip()}%")
+                )
+            else:
+                search_conditions = (
+                    (Contact.first_name.ilike(f"{term}%"))
+                    | (Contact.last_name.ilike(f"{term}%"))
+                    | (Contact.email.ilike(f"{term}%"))
+                )
 
-            # Scope by workspace if available, otherwise by user
+            # Select only the columns the response needs instead of hydrating
+            # Contact objects; scope by workspace if available, otherwise by user
+            base_stmt = select(
+                Contact.id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.phone_number,
+                Contact.email,
+                Contact.company_name,
+                Contact.status,
+            )
             if self.workspace_id:
-                stmt = select(Contact).where(
+                stmt = base_stmt.where(
                     Contact.workspace_id == self.workspace_id,
                     search_conditions,
                 )
             else:
-                stmt = select(Contact).where(
+                stmt = base_stmt.where(
                     Contact.user_id == self.user_id,
                     search_conditions,
                 )
 
-            result = await self.db.execute(stmt)
-            contacts = list(result.scalars().all())
+            # Newest contacts first, so the truncated result set is deterministic
+            stmt = stmt.order_by(Contact.created_at.desc(), Contact.id.desc())
+            result = await self.db.execute(stmt.limit(SEARCH_RESULT_LIMIT))
+            contacts = result.all()
 
             if not contacts:
                 return {
@@ -360,7 +756,7 @@ class CRMTools:
                     "company": c.company_name,
                     "status": c.status,
                 }
-                for c in contacts[:3]  # Limit to 3 results
+                for c in contacts
             ]
 
             return {
@@ -406,14 +802,16 @@ class CRMTools:
                 status="new",
             )
 
+            # The generated ID is populated by the INSERT; no refresh round trip needed
             self.db.add(contact)
             await self.db.commit()
-            await self.db.refresh(contact)
 
             # Invalidate CRM caches so new contacts appear immediately in the UI
             try:
-                await cache_invalidate(f"crm:contacts:list:{self.user_id}:*")
-                await cache_invalidate("crm:stats:*")
+                await asyncio.gather(
+                    cache_invalidate_index(f"crm:contacts:list:{self.user_id}:keys"),
+                    cache_delete(f"crm:stats:{self.user_id}"),
+                )
                 self.logger.debug("invalidated_crm_cache_after_create_contact")
             except Exception:
                 self.logger.exception("failed_to_invalidate_cache_after_create_contact")
@@ -443,42 +841,44 @@ class CRMTools:
             Available time slots
         """
         try:
-            # Parse date
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+            # Parse date into a half-open [day_start, day_end) range
+            day_start = parse_ymd(date)
+            day_end = day_start + timedelta(days=1)
 
             # Get existing appointments for that day - filtered by workspace or user
+            # Let the database reduce bookings to the distinct hours they occupy
             base_stmt = (
-                select(Appointment)
+                select(func.extract("hour", UtcTimestamp(Appointment.scheduled_at)))
+                .distinct()
                 .join(Contact)
                 .where(
-                    Appointment.scheduled_at >= datetime.combine(target_date, datetime.min.time()),
-                    Appointment.scheduled_at < datetime.combine(target_date, datetime.max.time()),
+                    Appointment.scheduled_at >= day_start,
+                    Appointment.scheduled_at < day_end,
                     Appointment.status == "scheduled",
                 )
             )
 
             if self.workspace_id:
-                stmt = base_stmt.where(Contact.workspace_id == self.workspace_id)
+                # Appointment.workspace_id lets Postgres range-scan the
+                # (workspace_id, status, scheduled_at) index
+                stmt = base_stmt.where(
+                    Appointment.workspace_id == self.workspace_id,
+                    Contact.workspace_id == self.workspace_id,
+                )
             else:
                 stmt = base_stmt.where(Contact.user_id == self.user_id)
 
             result = await self.db.execute(stmt)
-            booked_appointments = list(result.scalars().all())
-
-            # Simple availability: 9 AM to 5 PM, hourly slots
-            available_slots = []
-            for hour in range(9, 17):  # 9 AM to 5 PM
-                slot_time = datetime.combine(target_date, datetime.min.time()).replace(hour=hour)
-
-                # Check if slot conflicts with existing appointments
-                is_available = True
-                for apt in booked_appointments:
-                    if apt.scheduled_at.hour == hour:
-                        is_available = False
-                        break
-
-                if is_available:
-                    available_slots.append(slot_time.isoformat())
+            booked_hours = {int(hour) for hour in result.scalars()}
+
+            # Simple availability: hourly slots not already booked. The input may
+            # be unpadded ("2030-1-5"), so prefix slots with the normalized date
+            iso_date = day_start.date().isoformat()
+            available_slots = [
+                f"{iso_date}{suffix}"
+                for hour, suffix in zip(SLOT_HOURS, SLOT_SUFFIXES, strict=True)
+                if hour not in booked_hours
+            ]
 
             return {
                 "success": True,
@@ -491,7 +891,7 @@ class CRMTools:
             self.logger.exception("check_availability_failed", error=str(e))
             return {"success": False, "error": str(e)}
 
-    async def parse_date(self, date_expression: str) -> dict[str, Any]:  # noqa: PLR0912, PLR0915
+    async def parse_date(self, date_expression: str) -> dict[str, Any]:
         """Parse natural language date/time into ISO 8601 format.
 
         Args:
@@ -501,80 +901,16 @@ class CRMTools:
             Parsed datetime in ISO 8601 format with timezone
         """
         try:
-            # Get workspace timezone from user settings
-            from zoneinfo import ZoneInfo
-
-            from app.crud import get_user_api_keys  # type: ignore[import-untyped]
-
-            user_settings = await get_user_api_keys(
-                uuid.UUID(int=self.user_id), self.db, workspace_id=self.workspace_id
-            )
-            tz_name = user_settings.timezone if user_settings else "America/New_York"
-            tz = ZoneInfo(tz_name)
+            # Get workspace timezone from workspace settings
+            tz_name = await self._get_workspace_timezone() or "America/New_York"
+            tz = get_zoneinfo(tz_name)
 
             # Get current time in workspace timezone
             now = datetime.now(tz)
 
-            # Normalize input
-            text = date_expression.lower().strip()
-
-            # Parse time (e.g., "9am", "2pm", "14:00", "9:30am")
-            time_match = re.search(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", text)
-            hour = 9  # default
-            minute = 0
-
-            if time_match:
-                hour = int(time_match.group(1))
-                minute = int(time_match.group(2)) if time_match.group(2) else 0
-                am_pm = time_match.group(3)
-
-                # Convert 12-hour to 24-hour
-                if am_pm:
-                    if am_pm == "pm" and hour != 12:  # noqa: PLR2004
-                        hour += 12
-                    elif am_pm == "am" and hour == 12:  # noqa: PLR2004
-                        hour = 0
-
-            # Parse date
-            target_date = now.date()
-
-            # Handle specific day names
-            if "monday" in text:
-                target_day = 0
-            elif "tuesday" in text:
-                target_day = 1
-            elif "wednesday" in text:
-                target_day = 2
-            elif "thursday" in text:
-                target_day = 3
-            elif "friday" in text:
-                target_day = 4
-            elif "saturday" in text:
-                target_day = 5
-            elif "sunday" in text:
-                target_day = 6
-            elif "tomorrow" in text:
-                target_date = now.date() + timedelta(days=1)
-                target_day = None
-            elif "today" in text:
-                target_date = now.date()
-                target_day = None
-            else:
-                # Try to parse YYYY-MM-DD
-                date_match = re.search(r"(\d{4})-(\d{2})-(\d{2})", text)
-                if date_match:
-                    target_date = datetime.strptime(date_match.group(0), "%Y-%m-%d").date()
-                target_day = None
-
-            # If day name specified, find next occurrence
-            if target_day is not None:
-                days_ahead = target_day - now.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                # If "next" is mentioned, add another week
-                if "next" in text and days_ahead < 7:  # noqa: PLR2004
-                    days_ahead += 7
-                target_date = now.date() + timedelta(days=days_ahead)
+            target_date, hour, minute = resolve_date_expression(
+                date_expression.lower().strip(), now.date()
+            )
 
             # Combine date and time
             result_dt = datetime(
@@ -626,21 +962,25 @@ class CRMTools:
         Returns:
             Booking confirmation
         """
-        import time
-
         method_entry_time = time.perf_counter()
         contact_id_at_start = None
 
+        # Most booking logs are info/debug, which production filters out, so skip
+        # building their payloads (names, ISO strings, rounded timings) when disabled
+        log_info = self.logger.is_enabled_for(logging.INFO)
+        log_debug = self.logger.is_enabled_for(logging.DEBUG)
+
         # Entry point logging
-        self.logger.info(
-            "booking_appointment_started",
-            contact_phone=contact_phone,
-            scheduled_at=scheduled_at,
-            duration_minutes=duration_minutes,
-            service_type=service_type,
-            notes=notes[:50] if notes else None,
-            agent_id=agent_id,
-        )
+        if log_info:
+            self.logger.info(
+                "booking_appointment_started",
+                contact_phone=contact_phone,
+                scheduled_at=scheduled_at,
+                duration_minutes=duration_minutes,
+                service_type=service_type,
+                notes=notes[:50] if notes else None,
+                agent_id=agent_id,
+            )
 
         try:
             # Parameter validation
@@ -667,23 +1007,33 @@ class CRMTools:
                     expected_range=f"{MIN_DURATION}-{MAX_DURATION} minutes",
                 )
 
-            self.logger.debug(
-                "booking_appointment_parameter_validation_passed",
-                contact_phone_length=len(contact_phone),
-                scheduled_at_length=len(scheduled_at),
-                duration_valid=MIN_DURATION <= duration_minutes <= MAX_DURATION,
-            )
+            if log_debug:
+                self.logger.debug(
+                    "booking_appointment_parameter_validation_passed",
+                    contact_phone_length=len(contact_phone),
+                    scheduled_at_length=len(scheduled_at),
+                    duration_valid=MIN_DURATION <= duration_minutes <= MAX_DURATION,
+                )
 
             # Contact lookup with timing
             lookup_start = time.perf_counter()
 
             # Find contact - filtered by workspace or user for security
+            with_timezone = False
+            stmt: Select[Any]
             if self.workspace_id:
                 stmt = select(Contact).where(
                     Contact.workspace_id == self.workspace_id,
                     Contact.phone_number == contact_phone,
                 )
                 scope_type = "workspace"
+                # Read the workspace timezone in the same round trip, in case
+                # scheduled_at turns out to be naive
+                if not self._workspace_timezone_loaded:
+                    stmt = stmt.join(Workspace, Workspace.id == Contact.workspace_id).add_columns(
+                        Workspace.settings["timezone"].as_string()
+                    )
+                    with_timezone = True
             else:
                 stmt = select(Contact).where(
                     Contact.user_id == self.user_id,
@@ -691,78 +1041,62 @@ class CRMTools:
                 )
                 scope_type = "user"
 
-            self.logger.debug(
-                "contact_lookup_query_preparing",
-                scope_type=scope_type,
-                contact_phone=contact_phone,
-            )
-
-            result = await self.db.execute(stmt)
-            contact = result.scalar_one_or_none()
+            if log_debug:
+                self.logger.debug(
+                    "contact_lookup_query_preparing",
+                    scope_type=scope_type,
+                    contact_phone=contact_phone,
+                )
 
-            lookup_duration_ms = (time.perf_counter() - lookup_start) * 1000
+            # Booking only reads these fields, so skip loading notes, tags, etc.
+            stmt = stmt.options(
+                load_only(
+                    Contact.id,
+                    Contact.user_id,
+                    Contact.workspace_id,
+                    Contact.first_name,
+                    Contact.last_name,
+                    Contact.phone_number,
+                    Contact.status,
+                ),
+                raiseload("*"),
+            )
+            result = await self.db.execute(stmt.limit(1))
+            row = result.first()
+            contact = row[0] if row else None
+            if row and with_timezone:
+                self._workspace_timezone = row[1]
+                self._workspace_timezone_loaded = True
 
             if contact:
                 contact_id_at_start = contact.id
-                self.logger.info(
-                    "contact_lookup_success",
-                    contact_id=contact.id,
-                    contact_name=f"{contact.first_name} {contact.last_name or ''}".strip(),
-                    contact_status=contact.status,
-                    duration_ms=round(lookup_duration_ms, 2),
-                )
-            else:
+                if log_info:
+                    self.logger.info(
+                        "contact_lookup_success",
+                        contact_id=contact.id,
+                        contact_name=f"{contact.first_name} {contact.last_name or ''}".strip(),
+                        contact_status=contact.status,
+                        duration_ms=elapsed_ms(lookup_start),
+                    )
+            elif log_debug:
                 self.logger.debug(
                     "contact_lookup_no_match",
                     contact_phone=contact_phone,
-                    duration_ms=round(lookup_duration_ms, 2),
-                )
-
-            if not contact:
-                # Auto-create contact for SMS conversations
-                # This allows booking without explicit contact creation
-                creation_start = time.perf_counter()
-
-                self.logger.warning(
-                    "contact_not_found_auto_creating",
-                    phone=contact_phone,
-                    user_id=self.user_id,
-                    workspace_id=str(self.workspace_id),
-                    reason="appointment_booking_without_prior_contact_creation",
-                )
-
-                contact = Contact(
-                    user_id=self.user_id,
-                    workspace_id=self.workspace_id,
-                    first_name="SMS Contact",
-                    phone_number=contact_phone,
-                    status="new",
-                )
-                self.db.add(contact)
-                await self.db.flush()
-                await self.db.refresh(contact)
-
-                creation_duration_ms = (time.perf_counter() - creation_start) * 1000
-
-                self.logger.info(
-                    "contact_auto_created_success",
-                    contact_id=contact.id,
-                    phone=contact_phone,
-                    duration_ms=round(creation_duration_ms, 2),
-                    decision_reason="auto_create_on_first_booking",
+                    duration_ms=elapsed_ms(lookup_start),
                 )
 
             # Parse datetime and handle timezone
             parse_start = time.perf_counter()
 
-            self.logger.debug(
-                "appointment_datetime_parsing_start",
-                input_scheduled_at=scheduled_at,
-                input_format="ISO 8601 with optional Z suffix",
-            )
+            if log_debug:
+                self.logger.debug(
+                    "appointment_datetime_parsing_start",
+                    input_scheduled_at=scheduled_at,
+                    input_format="ISO 8601 with optional Z suffix",
+                )
 
             try:
-                appointment_time = datetime.fromisoformat(scheduled_at.replace("Z", "+00:00"))
+                appointment_time = datetime.fromisoformat(scheduled_at)
             except ValueError as parse_error:
                 self.logger.exception(
                     "appointment_datetime_parse_failed",
@@ -775,104 +1109,94 @@ class CRMTools:
                     "error": f"Invalid datetime format: {parse_error}. Expected ISO 8601 format (e.g., 2025-12-20T14:30:00 or 2025-12-20T14:30:00-05:00)",
                 }
 
-            parse_duration_ms = (time.perf_counter() - parse_start) * 1000
-
-            self.logger.debug(
-                "appointment_datetime_parsed",
-                parsed_datetime=appointment_time.isoformat(),
-                has_timezone=appointment_time.tzinfo is not None,
-                duration_ms=round(parse_duration_ms, 2),
-            )
-
-            # If datetime is naive (no timezone), interpret it in workspace timezone
-            if appointment_time.tzinfo is None and self.workspace_id:
-                tz_resolution_start = time.perf_counter()
-
+            if log_debug:
                 self.logger.debug(
-                    "appointment_datetime_naive_detected",
-                    datetime_value=appointment_time.isoformat(),
-                    workspace_id=str(self.workspace_id),
-                    next_step="resolve_workspace_timezone",
+                    "appointment_datetime_parsed",
+                    parsed_datetime=appointment_time.isoformat(),
+                    has_timezone=appointment_time.tzinfo is not None,
+                    duration_ms=elapsed_ms(parse_start),
                 )
 
-                from zoneinfo import ZoneInfo
+            # Aware datetimes (explicit offset or Z) skip timezone resolution entirely;
+            # naive ones are interpreted in the workspace timezone
+            if appointment_time.tzinfo is None:
+                if self.workspace_id:
+                    tz_resolution_start = time.perf_counter()
 
-                from app.models.workspace import Workspace
+                    if log_debug:
+                        self.logger.debug(
+                            "appointment_datetime_naive_detected",
+                            datetime_value=appointment_time.isoformat(),
+                            workspace_id=str(self.workspace_id),
+                            next_step="resolve_workspace_timezone",
+                        )
 
-                # Get workspace timezone
-                ws_result = await self.db.execute(
-                    select(Workspace).where(Workspace.id == self.workspace_id)
-                )
-                workspace = ws_result.scalar_one_or_none()
-
-                if workspace and workspace.settings:
-                    tz_name = workspace.settings.get("timezone", "UTC")
-                    self.logger.debug(
-                        "workspace_timezone_loaded",
-                        timezone=tz_name,
-                        workspace_id=str(self.workspace_id),
-                    )
+                    # Get workspace timezone (loaded once per instance)
+                    workspace_tz = await self._get_workspace_timezone()
+
+                    if workspace_tz:
+                        tz_name = workspace_tz
+                        if log_debug:
+                            self.logger.debug(
+                                "workspace_timezone_loaded",
+                                timezone=tz_name,
+                                workspace_id=str(self.workspace_id),
+                            )
+                    else:
+                        tz_name = "UTC"
+                        self.logger.warning(
+                            "workspace_timezone_not_configured_using_default",
+                            workspace_id=str(self.workspace_id),
+                            fallback_timezone="UTC",
+                        )
+
+                    try:
+                        tz = get_zoneinfo(tz_name)
+                        # Interpret the naive datetime as being in workspace timezone
+                        appointment_time = appointment_time.replace(tzinfo=tz)
+
+                        if log_info:
+                            self.logger.info(
+                                "appointment_datetime_timezone_resolved",
+                                original_naive=scheduled_at,
+                                timezone_name=tz_name,
+                                result_with_tz=appointment_time.isoformat(),
+                                duration_ms=elapsed_ms(tz_resolution_start),
+                                utc_equivalent=appointment_time.astimezone(UTC).isoformat(),
+                            )
+                    except Exception as tz_error:
+                        self.logger.exception(
+                            "timezone_conversion_failed_hard_error",
+                            timezone=tz_name,
+                            error=str(tz_error),
+                            error_type=type(tz_error).__name__,
+                            duration_ms=elapsed_ms(tz_resolution_start),
+                        )
+                        return {
+                            "success": False,
+                            "error": f"Failed to interpret datetime in timezone {tz_name}: {tz_error}",
+                        }
                 else:
-                    tz_name = "UTC"
                     self.logger.warning(
-                        "workspace_not_found_using_default_timezone",
-                        workspace_id=str(self.workspace_id),
-                        fallback_timezone="UTC",
+                        "appointment_datetime_naive_no_workspace",
+                        datetime_value=appointment_time.isoformat(),
+                        workspace_id=self.workspace_id,
+                        note="Naive datetime will be interpreted as UTC",
                     )
+                    appointment_time = appointment_time.replace(tzinfo=UTC)
 
-                try:
-                    tz = ZoneInfo(tz_name)
-                    # Interpret the naive datetime as being in workspace timezone
-                    appointment_time = appointment_time.replace(tzinfo=tz)
+            # appointment_time is always timezone-aware from here on. Validate it is
+            # in the future by comparing epoch seconds rather than building an
+            # aware "now" datetime.
+            appointment_epoch = appointment_time.timestamp()
+            now_epoch = time.time()
 
-                    tz_resolution_duration_ms = (time.perf_counter() - tz_resolution_start) * 1000
-
-                    self.logger.info(
-                        "appointment_datetime_timezone_resolved",
-                        original_naive=scheduled_at,
-                        timezone_name=tz_name,
-                        result_with_tz=appointment_time.isoformat(),
-                        duration_ms=round(tz_resolution_duration_ms, 2),
-                        utc_equivalent=appointment_time.astimezone(ZoneInfo("UTC")).isoformat(),
-                    )
-                except Exception as tz_error:
-                    tz_resolution_duration_ms = (time.perf_counter() - tz_resolution_start) * 1000
-
-                    self.logger.exception(
-                        "timezone_conversion_failed_hard_error",
-                        timezone=tz_name,
-                        error=str(tz_error),
-                        error_type=type(tz_error).__name__,
-                        duration_ms=round(tz_resolution_duration_ms, 2),
-                    )
-                    return {
-                        "success": False,
-                        "error": f"Failed to interpret datetime in timezone {tz_name}: {tz_error}",
-                    }
-            elif appointment_time.tzinfo is None:
-                self.logger.warning(
-                    "appointment_datetime_naive_no_workspace",
-                    datetime_value=appointment_time.isoformat(),
-                    workspace_id=self.workspace_id,
-                    note="Naive datetime will be stored without timezone info",
-                )
-
-            # Validate appointment is in the future
-            from zoneinfo import ZoneInfo
-
-            now_utc = datetime.now(ZoneInfo("UTC"))
-            appointment_utc = (
-                appointment_time.astimezone(ZoneInfo("UTC"))
-                if appointment_time.tzinfo
-                else appointment_time
-            )
-
-            if appointment_utc <= now_utc:
-                time_diff_seconds = (now_utc - appointment_utc).total_seconds()
+            if appointment_epoch <= now_epoch:
+                time_diff_seconds = now_epoch - appointment_epoch
                 self.logger.error(
                     "appointment_datetime_in_past",
                     scheduled_at=appointment_time.isoformat(),
-                    now_utc=now_utc.isoformat(),
+                    now_utc=datetime.fromtimestamp(now_epoch, UTC).isoformat(),
                     time_diff_seconds=round(time_diff_seconds, 2),
                 )
                 return {
@@ -880,32 +1204,64 @@ class CRMTools:
                     "error": f"Cannot book appointment in the past. Scheduled time {appointment_time.isoformat()} is {round(time_diff_seconds / 3600, 1)} hours ago.",
                 }
 
-            self.logger.debug(
-                "appointment_datetime_future_validation_passed",
-                scheduled_at=appointment_time.isoformat(),
-                now_utc=now_utc.isoformat(),
-                time_until_appointment_hours=round(
-                    (appointment_utc - now_utc).total_seconds() / 3600, 2
-                ),
-            )
+            if log_debug:
+                self.logger.debug(
+                    "appointment_datetime_future_validation_passed",
+                    scheduled_at=appointment_time.isoformat(),
+                    now_utc=datetime.fromtimestamp(now_epoch, UTC).isoformat(),
+                    time_until_appointment_hours=round((appointment_epoch - now_epoch) / 3600, 2),
+                )
 
-            # Create appointment (inherit workspace_id from contact)
-            creation_start = time.perf_counter()
+            # Convert agent_id string to UUID if provided
+            agent_uuid = uuid.UUID(agent_id) if agent_id else None
 
-            self.logger.debug(
-                "appointment_creating",
-                contact_id=contact.id,
-                workspace_id=str(contact.workspace_id),
-                scheduled_at=appointment_time.isoformat(),
-                duration_minutes=duration_minutes,
-                service_type=service_type,
-                agent_id=agent_id,
-            )
+            # Everything is validated by now. Only add the contact at this point, so a
+            # rejected booking leaves nothing pending in the call's shared session
+            if not contact:
+                # Auto-create contact for SMS conversations
+                # This allows booking without explicit contact creation
+                creation_start = time.perf_counter()
 
-            # Convert agent_id string to UUID if provided
-            import uuid as uuid_module
+                self.logger.warning(
+                    "contact_not_found_auto_creating",
+                    phone=contact_phone,
+                    user_id=self.user_id,
+                    workspace_id=str(self.workspace_id),
+                    reason="appointment_booking_without_prior_contact_creation",
+                )
+
+                contact = Contact(
+                    user_id=self.user_id,
+                    workspace_id=self.workspace_id,
+                    first_name="SMS Contact",
+                    phone_number=contact_phone,
+                    status="new",
+                )
+                self.db.add(contact)
+                await self.db.flush()
+
+                if log_info:
+                    self.logger.info(
+                        "contact_auto_created_success",
+                        contact_id=contact.id,
+                        phone=contact_phone,
+                        duration_ms=elapsed_ms(creation_start),
+                        decision_reason="auto_create_on_first_booking",
+                    )
 
-            agent_uuid = uuid_module.UUID(agent_id) if agent_id else None
+            # Create appointment (inherit workspace_id from contact)
+            creation_start = time.perf_counter()
+
+            if log_debug:
+                self.logger.debug(
+                    "appointment_creating",
+                    contact_id=contact.id,
+                    workspace_id=str(contact.workspace_id),
+                    scheduled_at=appointment_time.isoformat(),
+                    duration_minutes=duration_minutes,
+                    service_type=service_type,
+                    agent_id=agent_id,
+                )
 
             appointment = Appointment(
                 contact_id=contact.id,
@@ -919,105 +1275,79 @@ class CRMTools:
             )
 
             self.db.add(appointment)
-
-            commit_start = time.perf_counter()
-            self.logger.debug(
-                "appointment_database_commit_starting",
-                contact_id=contact.id,
-                workspace_id=str(contact.workspace_id),
-            )
-
-            await self.db.commit()
-            await self.db.refresh(appointment)
-
-            commit_duration_ms = (time.perf_counter() - commit_start) * 1000
-            total_creation_duration_ms = (time.perf_counter() - creation_start) * 1000
-
-            self.logger.info(
-                "appointment_created_in_database",
-                appointment_id=appointment.id,
-                contact_id=appointment.contact_id,
-                workspace_id=str(appointment.workspace_id),
-                agent_id=str(appointment.agent_id) if appointment.agent_id else None,
-                scheduled_at=appointment.scheduled_at.isoformat(),
-                status=appointment.status,
-                duration_minutes=appointment.duration_minutes,
-                service_type=appointment.service_type,
-                commit_duration_ms=round(commit_duration_ms, 2),
-                total_creation_duration_ms=round(total_creation_duration_ms, 2),
-            )
+            # Flush to assign the appointment ID so the calendar sync entries can
+            # reference it and be committed in the same transaction. Every field the
+            # response needs is already set locally, so no refresh follows the commit.
+            await self.db.flush()
 
             # Enqueue calendar sync
             sync_start = time.perf_counter()
 
-            self.logger.debug(
-                "calendar_sync_enqueueing",
-                appointment_id=appointment.id,
-                workspace_id=str(appointment.workspace_id),
-                operation="create",
-            )
+            if log_debug:
+                self.logger.debug(
+                    "calendar_sync_enqueueing",
+                    appointment_id=appointment.id,
+                    workspace_id=str(appointment.workspace_id),
+                    operation="create",
+                )
 
             await self._enqueue_calendar_sync(appointment, operation="create")
 
-            sync_duration_ms = (time.perf_counter() - sync_start) * 1000
-
-            self.logger.debug(
-                "calendar_sync_enqueued",
-                appointment_id=appointment.id,
-                workspace_id=str(appointment.workspace_id),
-                duration_ms=round(sync_duration_ms, 2),
-                status="queued_for_async_processing",
-            )
-
-            # Invalidate CRM stats cache after booking
-            cache_start = time.perf_counter()
-
-            try:
+            if log_debug:
                 self.logger.debug(
-                    "cache_invalidation_starting",
-                    cache_pattern="crm:stats:*",
-                    reason="appointment_created",
+                    "calendar_sync_enqueued",
+                    appointment_id=appointment.id,
+                    workspace_id=str(appointment.workspace_id),
+                    duration_ms=elapsed_ms(sync_start),
+                    status="queued_for_async_processing",
                 )
 
-                await cache_invalidate("crm:stats:*")
-
-                cache_duration_ms = (time.perf_counter() - cache_start) * 1000
-
+            commit_start = time.perf_counter()
+            if log_debug:
                 self.logger.debug(
-                    "cache_invalidation_success",
-                    cache_pattern="crm:stats:*",
-                    duration_ms=round(cache_duration_ms, 2),
+                    "appointment_database_commit_starting",
+                    contact_id=contact.id,
+                    workspace_id=str(contact.workspace_id),
                 )
-            except Exception as cache_error:
-                cache_duration_ms = (time.perf_counter() - cache_start) * 1000
 
-                self.logger.exception(
-                    "failed_to_invalidate_cache_after_book_appointment",
-                    error=str(cache_error),
-                    error_type=type(cache_error).__name__,
-                    duration_ms=round(cache_duration_ms, 2),
-                    impact="cache_hit_may_return_stale_stats",
+            # Contact, appointment and sync entries are committed together
+            await self.db.commit()
+
+            if log_info:
+                self.logger.info(
+                    "appointment_created_in_database",
+                    appointment_id=appointment.id,
+                    contact_id=appointment.contact_id,
+                    workspace_id=str(appointment.workspace_id),
+                    agent_id=str(appointment.agent_id) if appointment.agent_id else None,
+                    scheduled_at=appointment.scheduled_at.isoformat(),
+                    status=appointment.status,
+                    duration_minutes=appointment.duration_minutes,
+                    service_type=appointment.service_type,
+                    commit_duration_ms=elapsed_ms(commit_start),
+                    total_creation_duration_ms=elapsed_ms(creation_start),
                 )
-                # Don't raise - cache failure shouldn't block appointment success
 
-            # Success response
-            total_execution_duration_ms = (time.perf_counter() - method_entry_time) * 1000
+            # Only invalidate once committed, so a concurrent read can't re-cache stale stats
+            await self._invalidate_stats_cache(contact.user_id, reason="appointment_created")
 
-            self.logger.info(
-                "booking_appointment_success",
-                appointment_id=appointment.id,
-                contact_id=contact.id,
-                contact_name=f"{contact.first_name} {contact.last_name or ''}".strip(),
-                contact_phone=contact.phone_number,
-                scheduled_at=appointment.scheduled_at.isoformat(),
-                duration_minutes=appointment.duration_minutes,
-                service_type=service_type,
-                was_contact_auto_created=(contact_id_at_start is None),
-                workspace_id=str(appointment.workspace_id),
-                agent_id=str(appointment.agent_id) if appointment.agent_id else None,
-                user_id=self.user_id,
-                total_duration_ms=round(total_execution_duration_ms, 2),
-            )
+            # Success response
+            if log_info:
+                self.logger.info(
+                    "booking_appointment_success",
+                    appointment_id=appointment.id,
+                    contact_id=contact.id,
+                    contact_name=f"{contact.first_name} {contact.last_name or ''}".strip(),
+                    contact_phone=contact.phone_number,
+                    scheduled_at=appointment.scheduled_at.isoformat(),
+                    duration_minutes=appointment.duration_minutes,
+                    service_type=service_type,
+                    was_contact_auto_created=(contact_id_at_start is None),
+                    workspace_id=str(appointment.workspace_id),
+                    agent_id=str(appointment.agent_id) if appointment.agent_id else None,
+                    user_id=self.user_id,
+                    total_duration_ms=elapsed_ms(method_entry_time),
+                )
 
             return {
                 "success": True,
@@ -1025,16 +1355,10 @@ class CRMTools:
                 "customer_name": f"{contact.first_name} {contact.last_name or ''}",
                 "scheduled_at": appointment.scheduled_at.isoformat(),
                 "duration_minutes": appointment.duration_minutes,
-                "message": f"Appointment booked for {contact.first_name} on {appointment.scheduled_at.strftime('%B %d at %I:%M %p')}",
+                "message": f"Appointment booked for {contact.first_name} on {format_appointment_time(appointment.scheduled_at)}",
             }
 
         except Exception as e:
-            execution_duration_ms = (
-                (time.perf_counter() - method_entry_time) * 1000
-                if "method_entry_time" in locals()
-                else None
-            )
-
             self.logger.exception(
                 "book_appointment_failed",
                 error=str(e),
@@ -1046,11 +1370,12 @@ class CRMTools:
                 agent_id=agent_id,
                 user_id=self.user_id,
                 workspace_id=str(self.workspace_id),
-                execution_duration_ms=round(execution_duration_ms, 2)
-                if execution_duration_ms
-                else None,
+                execution_duration_ms=elapsed_ms(method_entry_time),
                 traceback_available=True,
             )
+            # Discard the contact/appointment flushed so far, so the next tool call
+            # to commit on this session doesn't save them and the session is usable
+            await self.db.rollback()
             return {
                 "success": False,
                 "error": str(e),
@@ -1064,25 +1389,41 @@ class CRMTools:
         start_date: str | None = None,
         end_date: str | None = None,
         status: str | None = None,
+        limit: int = APPOINTMENT_LIST_LIMIT,
     ) -> dict[str, Any]:
         """List appointments with optional filters.
 
         Args:
             contact_phone: Filter by phone
             start_date: Start date filter
-            end_date: End date filter
+            end_date: End date filter (inclusive)
             status: Status filter
+            limit: Maximum number of appointments to return
 
         Returns:
-            List of appointments
+            List of appointments, earliest first
         """
         try:
-            # Use selectinload to eagerly load contacts in a single query (fixes N+1)
-            # Filter by workspace or user for security
-            base_stmt = select(Appointment).join(Contact).options(selectinload(Appointment.contact))
+            # Select only the columns the listing needs instead of hydrating
+            # Appointment and Contact objects; filter by workspace or user for security
+            base_stmt = select(
+                Appointment.id,
+                Appointment.scheduled_at,
+                Appointment.duration_minutes,
+                Appointment.service_type,
+                Appointment.status,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.phone_number,
+            ).join(Contact)
 
             if self.workspace_id:
-                stmt = base_stmt.where(Contact.workspace_id == self.workspace_id)
+                # Filter on Appointment.workspace_id too, so the status filter and
+                # scheduled_at ordering are served by the workspace schedule index
+                stmt = base_stmt.where(
+                    Appointment.workspace_id == self.workspace_id,
+                    Contact.workspace_id == self.workspace_id,
+                )
             else:
                 stmt = base_stmt.where(Contact.user_id == self.user_id)
 
@@ -1091,35 +1432,36 @@ class CRMTools:
                 stmt = stmt.where(Contact.phone_number == contact_phone)
 
             if start_date:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+                start_dt = parse_ymd(start_date)
                 stmt = stmt.where(Appointment.scheduled_at >= start_dt)
 
             if end_date:
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                stmt = stmt.where(Appointment.scheduled_at <= end_dt)
+                # Half-open range so appointments during the end date are included
+                end_dt = parse_ymd(end_date) + timedelta(days=1)
+                stmt = stmt.where(Appointment.scheduled_at < end_dt)
 
             if status:
                 stmt = stmt.where(Appointment.status == status)
             else:
                 stmt = stmt.where(Appointment.status == "scheduled")
 
-            stmt = stmt.order_by(Appointment.scheduled_at)
+            stmt = stmt.order_by(Appointment.scheduled_at).limit(limit)
 
             result = await self.db.execute(stmt)
-            appointments = list(result.scalars().all())
 
-            # Contact is already loaded via selectinload - no additional queries needed
+            # Build the response straight from the buffered rows, without first
+            # copying them into an intermediate list
             appointment_list = [
                 {
-                    "id": apt.id,
-                    "customer_name": f"{apt.contact.first_name} {apt.contact.last_name or ''}",
-                    "phone": apt.contact.phone_number,
-                    "scheduled_at": apt.scheduled_at.isoformat(),
-                    "duration_minutes": apt.duration_minutes,
-                    "service_type": apt.service_type,
-                    "status": apt.status,
+                    "id": row.id,
+                    "customer_name": f"{row.first_name} {row.last_name or ''}",
+                    "phone": row.phone_number,
+                    "scheduled_at": row.scheduled_at.isoformat(),
+                    "duration_minutes": row.duration_minutes,
+                    "service_type": row.service_type,
+                    "status": row.status,
                 }
-                for apt in appointments
+                for row in result
             ]
 
             return {
@@ -1145,14 +1487,33 @@ class CRMTools:
             Cancellation confirmation
         """
         try:
-            # Verify appointment belongs to user's workspace/contact
-            base_stmt = select(Appointment).join(Contact).where(Appointment.id == appointment_id)
+            # Only appointments of contacts in the user's workspace/contacts qualify
+            owned_contacts = select(Contact.id).where(
+                Contact.workspace_id == self.workspace_id
+                if self.workspace_id
+                else Contact.user_id == self.user_id
+            )
 
-            if self.workspace_id:
-                stmt = base_stmt.where(Contact.workspace_id == self.workspace_id)
-            else:
-                stmt = base_stmt.where(Contact.user_id == self.user_id)
+            values: dict[str, Any] = {"status": "cancelled"}
+            if reason:
+                reason_note = f"Cancellation reason: {reason}"
+                values["notes"] = func.coalesce(
+                    func.nullif(Appointment.notes, "") + f"\n\n{reason_note}", reason_note
+                )
 
+            # Update and fetch in one statement; notes are deferred but needed for
+            # the calendar sync payload, so they come back with the row
+            stmt = (
+                update(Appointment)
+                .where(
+                    Appointment.id == appointment_id,
+                    Appointment.contact_id.in_(owned_contacts),
+                )
+                .values(**values)
+                .returning(Appointment)
+                .options(undefer(Appointment.notes), raiseload("*"))
+                .execution_options(populate_existing=True)
+            )
             result = await self.db.execute(stmt)
             appointment = result.scalar_one_or_none()
 
@@ -1162,24 +1523,14 @@ class CRMTools:
                     "error": f"Appointment {appointment_id} not found",
                 }
 
-            # Update status
-            appointment.status = "cancelled"
-            if reason:
-                appointment.notes = (
-                    f"{appointment.notes}\n\nCancellation reason: {reason}"
-                    if appointment.notes
-                    else f"Cancellation reason: {reason}"
-                )
-
-            await self.db.commit()
-
-            # Enqueue calendar sync
+            # Enqueue calendar sync alongside the status change
             await self._enqueue_calendar_sync(appointment, operation="cancel")
+            await self.db.commit()
 
             return {
                 "success": True,
                 "appointment_id": appointment_id,
-                "message": f"Appointment on {appointment.scheduled_at.strftime('%B %d at %I:%M %p')} has been cancelled",
+                "message": f"Appointment on {format_appointment_time(appointment.scheduled_at)} has been cancelled",
             }
 
         except Exception as e:
@@ -1200,7 +1551,15 @@ class CRMTools:
         """
         try:
             # Verify appointment belongs to user's workspace/contact
-            base_stmt = select(Appointment).join(Contact).where(Appointment.id == appointment_id)
+            # Notes are deferred but needed for the calendar sync payload; load them
+            # with the row rather than lazily (which an AsyncSession can't do), and
+            # make any relationship access fail loudly instead of lazy loading
+            base_stmt = (
+                select(Appointment)
+                .options(undefer(Appointment.notes), raiseload("*"))
+                .join(Contact)
+                .where(Appointment.id == appointment_id)
+            )
 
             if self.workspace_id:
                 stmt = base_stmt.where(Contact.workspace_id == self.workspace_id)
@@ -1217,29 +1576,30 @@ class CRMTools:
                 }
 
             # Parse new datetime
-            new_time = datetime.fromisoformat(new_scheduled_at.replace("Z", "+00:00"))
+            new_time = datetime.fromisoformat(new_scheduled_at)
 
             old_time = appointment.scheduled_at
             appointment.scheduled_at = new_time
 
-            await self.db.commit()
-
-            # Enqueue calendar sync
+            # Enqueue calendar sync alongside the new time
             await self._enqueue_calendar_sync(appointment, operation="update")
+            await self.db.commit()
 
+            old_time_text = format_appointment_time(old_time)
+            new_time_text = format_appointment_time(new_time)
             return {
                 "success": True,
                 "appointment_id": appointment_id,
-                "old_time": old_time.strftime("%B %d at %I:%M %p"),
-                "new_time": new_time.strftime("%B %d at %I:%M %p"),
-                "message": f"Appointment rescheduled from {old_time.strftime('%B %d at %I:%M %p')} to {new_time.strftime('%B %d at %I:%M %p')}",
+                "old_time": old_time_text,
+                "new_time": new_time_text,
+                "message": f"Appointment rescheduled from {old_time_text} to {new_time_text}",
             }
 
         except Exception as e:
             self.logger.exception("reschedule_appointment_failed", error=str(e))
             return {"success": False, "error": str(e)}
 
-    async def execute_tool(  # noqa: PLR0911
+    async def execute_tool(
         self, tool_name: str, arguments: dict[str, Any], agent_id: str | None = None
     ) -> dict[str, Any]:
         """Execute a CRM tool by name.
@@ -1252,21 +1612,10 @@ class CRMTools:
         Returns:
             Tool result
         """
-        if tool_name == "search_customer":
-            return await self.search_customer(**arguments)
-        if tool_name == "create_contact":
-            return await self.create_contact(**arguments)
-        if tool_name == "check_availability":
-            return await self.check_availability(**arguments)
+        handler = self._tool_map.get(tool_name)
+        if handler:
+            return await handler(**arguments)
         if tool_name == "book_appointment":
             # Inject agent_id into arguments for book_appointment
             return await self.book_appointment(**arguments, agent_id=agent_id)
-        if tool_name == "list_appointments":
-            return await self.list_appointments(**arguments)
-        if tool_name == "cancel_appointment":
-            return await self.cancel_appointment(**arguments)
-        if tool_name == "reschedule_appointment":
-            return await self.reschedule_appointment(**arguments)
-        if tool_name == "parse_date":
-            return await self.parse_date(**arguments)
         return {"success": False, "error": f"Unknown tool: {tool_name}"}
@@ -9,13 +9,19 @@ API Docs: https://docs.followupboss.com/reference/getting-started
 Base URL: https://api.followupboss.com/v1
 """
 
+import copy
+import re
+import time
 from collections.abc import Awaitable, Callable
 from http import HTTPStatus
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 
+from app.services.tools.http_client_pool import SharedClientPool
+
 # Type alias for tool handler functions
 ToolHandler = Callable[..., Awaitable[dict[str, Any]]]
 
@@ -28,6 +34,177 @@ FUB_BASE_URL = "https://api.followupboss.com/v1"
 FUB_SYSTEM_NAME = "Prestyj-Real-Estate"
 FUB_SYSTEM_KEY = "f8037a8664edce80ecc4532956114464"
 
+# Keep connections warm across tool calls (e.g. search then create) instead of
+# re-handshaking each time; HTTP/2 lets concurrent calls share one connection
+CLIENT_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# Connection errors are retried by the transport (nothing was sent yet)
+CONNECT_RETRIES = 1
+
+# Agents often look the same caller up several times in one conversation;
+# a short TTL keeps that context fresh enough without a round trip each time
+PERSON_CACHE_TTL_SECONDS = 60.0
+
+# Upper bound per cache, so a long call with many distinct searches stays small
+PERSON_CACHE_MAX_ENTRIES = 128
+
+# Maximum number of people returned by fub_search_person
+SEARCH_RESULT_LIMIT = 3
+
+# Phone-number-like search queries, cached by their digits so "(555) 123-4567"
+# and "555-123-4567" share an entry
+PHONE_QUERY_PATTERN = re.compile(r"[\d\s()+.-]+")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+
+# OpenAI function calling tool definitions, built once at import time.
+# Shared by every session, so callers must treat the dicts as read-only.
+_TOOL_DEFINITIONS: list[dict[str, Any]] = [
+    {
+        "type": "function",
+        "name": "fub_search_person",
+        "description": "Search for a person in FollowUpBoss by phone number, email, or name",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Phone number, email, or name to search for",
+                },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "fub_get_person",
+        "description": "Get full details of a person by their FollowUpBoss person ID",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "person_id": {
+                    "type": "string",
+                    "description": "FollowUpBoss person ID",
+                },
+            },
+            "required": ["person_id"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "fub_create_lead",
+        "description": (
+            "Create a new lead in FollowUpBoss with event tracking. "
+            "This is the preferred method as it triggers automations and prevents duplicates."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "first_name": {"type": "string", "description": "First name"},
+                "last_name": {"type": "string", "description": "Last name"},
+                "phone": {"type": "string", "description": "Phone number"},
+                "email": {"type": "string", "description": "Email address"},
+                "source": {
+                    "type": "string",
+                    "description": "Lead source (e.g., Voice Agent, Phone Call)",
+                },
+                "message": {
+                    "type": "string",
+                    "description": "Notes or message about the inquiry",
+                },
+            },
+            "required": ["first_name", "phone"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "fub_create_person",
+        "description": (
+            "Create a new person in FollowUpBoss without event tracking. "
+            "Note: This does NOT trigger automations. Use fub_create_lead for leads."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "first_name": {"type": "string", "description": "First name"},
+                "last_name": {"type": "string", "description": "Last name"},
+                "phone": {"type": "string", "description": "Phone number"},
+                "email": {"type": "string", "description": "Email address"},
+            },
+            "required": ["first_name"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "fub_update_person",
+        "description": "Update an existing person in FollowUpBoss",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "person_id": {"type": "string", "description": "Person ID to update"},
+                "first_name": {"type": "string", "description": "First name"},
+                "last_name": {"type": "string", "description": "Last name"},
+                "phone": {"type": "string", "description": "Phone number"},
+                "email": {"type": "string", "description": "Email address"},
+            },
+            "required": ["person_id"],
+        },
+    },
+    {
+        "type": "function",
+        "name": "fub_add_note",
+        "description": "Add a note to a person in FollowUpBoss",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "person_id": {"type": "string", "description": "Person ID"},
+                "subject": {"type": "string", "description": "Note subject"},
+                "body": {"type": "string", "description": "Note content"},
+            },
+            "required": ["person_id", "body"],
+        },
+    },
+]
+
+
+CacheEntries = dict[str, tuple[float, dict[str, Any]]]
+
+
+def _cache_get(cache: CacheEntries, key: str) -> dict[str, Any] | None:
+    """Get a copy of a cached result if it is younger than PERSON_CACHE_TTL_SECONDS.
+
+    Results nest people and their phones/emails, so callers get a deep copy
+    they can modify without changing the cached entry.
+    """
+    entry = cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= PERSON_CACHE_TTL_SECONDS:
+        return None
+    return copy.deepcopy(entry[1])
+
+
+def _cache_put(cache: CacheEntries, key: str, value: dict[str, Any]) -> None:
+    """Cache a result, evicting expired entries and the oldest beyond the size cap.
+
+    Entries are kept in insertion order, which is also expiry order, so expired
+    ones always form a prefix and eviction stops at the first fresh entry.
+    """
+    now = time.monotonic()
+    cache.pop(key, None)
+    while cache:
+        oldest_key, (cached_at, _) = next(iter(cache.items()))
+        if now - cached_at < PERSON_CACHE_TTL_SECONDS and len(cache) < PERSON_CACHE_MAX_ENTRIES:
+            break
+        del cache[oldest_key]
+    cache[key] = (now, copy.deepcopy(value))
+
+
+# Process-wide clients keyed by API key so concurrent sessions share one pool
+_client_pool = SharedClientPool("followupboss")
+
 
 class FollowUpBossTools:
     """FollowUpBoss CRM tools for voice agents.
@@ -48,29 +225,47 @@ class FollowUpBossTools:
         self.api_key = api_key
         self.logger = logger.bind(component="followupboss_tools")
         self._client: httpx.AsyncClient | None = None
+        self._person_cache: CacheEntries = {}
+        self._search_cache: CacheEntries = {}
+        self._tool_map: dict[str, ToolHandler] = {
+            "fub_search_person": self.fub_search_person,
+            "fub_get_person": self.fub_get_person,
+            "fub_create_lead": self.fub_create_lead,
+            "fub_create_person": self.fub_create_person,
+            "fub_update_person": self.fub_update_person,
+            "fub_add_note": self.fub_add_note,
+        }
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with Basic Auth and system headers."""
+        # FollowUpBoss uses Basic Auth: API key as username, blank password
+        return httpx.AsyncClient(
+            base_url=FUB_BASE_URL,
+            auth=(self.api_key, ""),  # Basic Auth with API key as username
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "X-System-Name": FUB_SYSTEM_NAME,  # Required for Inbox Apps API
+                "X-System-Key": FUB_SYSTEM_KEY,  # Required for Inbox Apps API
+            },
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=CLIENT_LIMITS, retries=CONNECT_RETRIES
+            ),
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with Basic Auth and system headers."""
-        if self._client is None:
-            # FollowUpBoss uses Basic Auth: API key as username, blank password
-            self._client = httpx.AsyncClient(
-                base_url=FUB_BASE_URL,
-                auth=(self.api_key, ""),  # Basic Auth with API key as username
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                    "X-System-Name": FUB_SYSTEM_NAME,  # Required for Inbox Apps API
-                    "X-System-Key": FUB_SYSTEM_KEY,  # Required for Inbox Apps API
-                },
-                timeout=30.0,
-            )
+        """Get the shared HTTP client for this API key, creating it on first use."""
+        self._client = _client_pool.acquire(self.api_key, self._client, self._build_client)
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the shared HTTP client, closing it once no instance uses it."""
+        if self._client is None:
+            return
+
+        client, self._client = self._client, None
+        await _client_pool.release(self.api_key, client)
 
     @staticmethod
     def get_tool_definitions() -> list[dict[str, Any]]:
@@ -79,112 +274,7 @@ class FollowUpBossTools:
         Returns:
             List of tool definitions for GPT Realtime API
         """
-        return [
-            {
-                "type": "function",
-                "name": "fub_search_person",
-                "description": "Search for a person in FollowUpBoss by phone number, email, or name",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Phone number, email, or name to search for",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "fub_get_person",
-                "description": "Get full details of a person by their FollowUpBoss person ID",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "person_id": {
-                            "type": "string",
-                            "description": "FollowUpBoss person ID",
-                        },
-                    },
-                    "required": ["person_id"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "fub_create_lead",
-                "description": (
-                    "Create a new lead in FollowUpBoss with event tracking. "
-                    "This is the preferred method as it triggers automations and prevents duplicates."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "first_name": {"type": "string", "description": "First name"},
-                        "last_name": {"type": "string", "description": "Last name"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                        "source": {
-                            "type": "string",
-                            "description": "Lead source (e.g., Voice Agent, Phone Call)",
-                        },
-                        "message": {
-                            "type": "string",
-                            "description": "Notes or message about the inquiry",
-                        },
-                    },
-                    "required": ["first_name", "phone"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "fub_create_person",
-                "description": (
-                    "Create a new person in FollowUpBoss without event tracking. "
-                    "Note: This does NOT trigger automations. Use fub_create_lead for leads."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "first_name": {"type": "string", "description": "First name"},
-                        "last_name": {"type": "string", "description": "Last name"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                    },
-                    "required": ["first_name"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "fub_update_person",
-                "description": "Update an existing person in FollowUpBoss",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "person_id": {"type": "string", "description": "Person ID to update"},
-                        "first_name": {"type": "string", "description": "First name"},
-                        "last_name": {"type": "string", "description": "Last name"},
-                        "phone": {"type": "string", "description": "Phone number"},
-                        "email": {"type": "string", "description": "Email address"},
-                    },
-                    "required": ["person_id"],
-                },
-            },
-            {
-                "type": "function",
-                "name": "fub_add_note",
-                "description": "Add a note to a person in FollowUpBoss",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "person_id": {"type": "string", "description": "Person ID"},
-                        "subject": {"type": "string", "description": "Note subject"},
-                        "body": {"type": "string", "description": "Note content"},
-                    },
-                    "required": ["person_id", "body"],
-                },
-            },
-        ]
+        return list(_TOOL_DEFINITIONS)
 
     async def fub_search_person(self, query: str) -> dict[str, Any]:
         """Search for a person by phone, email, or name.
@@ -195,6 +285,13 @@ class FollowUpBossTools:
         Returns:
             Person information or error
         """
+        term = query.strip()
+        digits = NON_DIGIT_PATTERN.sub("", term)
+        cache_key = digits if digits and PHONE_QUERY_PATTERN.fullmatch(term) else term.lower()
+        cached = _cache_get(self._search_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             client = await self._get_client()
 
@@ -203,7 +300,7 @@ class FollowUpBossTools:
                 "/people",
                 params={
                     "query": query,
-                    "limit": 5,
+                    "limit": SEARCH_RESULT_LIMIT,
                 },
             )
 
@@ -215,15 +312,17 @@ class FollowUpBossTools:
                 )
                 return {"success": False, "error": f"API error: {response.status_code}"}
 
-            data = response.json()
+            data = orjson.loads(response.content)
             people = data.get("people", [])
 
             if not people:
-                return {
+                result: dict[str, Any] = {
                     "success": True,
                     "found": False,
                     "message": f"No person found matching '{query}'",
                 }
+                _cache_put(self._search_cache, cache_key, result)
+                return result
 
             # Format results
             person_list = [
@@ -236,15 +335,17 @@ class FollowUpBossTools:
                     "phone": p.get("phones", [{}])[0].get("value") if p.get("phones") else None,
                     "source": p.get("source"),
                 }
-                for p in people[:3]
+                for p in people[:SEARCH_RESULT_LIMIT]
             ]
 
-            return {
+            result = {
                 "success": True,
                 "found": True,
                 "count": len(person_list),
                 "people": person_list,
             }
+            _cache_put(self._search_cache, cache_key, result)
+            return result
 
         except Exception as e:
             self.logger.exception("fub_search_person_error", query=query, error=str(e))
@@ -259,6 +360,11 @@ class FollowUpBossTools:
         Returns:
             Person details or error
         """
+        cache_key = str(person_id)
+        cached = _cache_get(self._person_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             client = await self._get_client()
             response = await client.get(f"/people/{person_id}")
@@ -266,9 +372,9 @@ class FollowUpBossTools:
             if response.status_code != HTTPStatus.OK:
                 return {"success": False, "error": f"Person not found: {response.status_code}"}
 
-            person = response.json()
+            person = orjson.loads(response.content)
 
-            return {
+            result = {
                 "success": True,
                 "person": {
                     "id": person.get("id"),
@@ -282,6 +388,8 @@ class FollowUpBossTools:
                     "created": person.get("created"),
                 },
             }
+            _cache_put(self._person_cache, cache_key, result)
+            return result
 
         except Exception as e:
             self.logger.exception("fub_get_person_error", person_id=person_id, error=str(e))
@@ -335,7 +443,8 @@ class FollowUpBossTools:
             if message:
                 payload["message"] = message
 
-            response = await client.post("/events", json=payload)
+            # Encode with orjson; the client already sends Content-Type: application/json
+            response = await client.post("/events", content=orjson.dumps(payload))
 
             if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
                 self.logger.warning(
@@ -345,8 +454,11 @@ class FollowUpBossTools:
                 )
                 return {"success": False, "error": f"Failed to create lead: {response.text}"}
 
-            data = response.json()
+            # A new or merged person can change what earlier searches return
+            self._search_cache.clear()
+            data = orjson.loads(response.content)
             person = data.get("person", {})
+            self._person_cache.pop(str(person.get("id")), None)
 
             return {
                 "success": True,
@@ -392,7 +504,7 @@ class FollowUpBossTools:
             if email:
                 payload["emails"] = [{"value": email}]
 
-            response = await client.post("/people", json=payload)
+            response = await client.post("/people", content=orjson.dumps(payload))
 
             if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
                 self.logger.warning(
@@ -402,7 +514,8 @@ class FollowUpBossTools:
                 )
                 return {"success": False, "error": f"Failed to create person: {response.text}"}
 
-            person = response.json()
+            self._search_cache.clear()
+            person = orjson.loads(response.content)
 
             return {
                 "success": True,
@@ -450,11 +563,37 @@ class FollowUpBossTools:
             if not payload:
                 return {"success": False, "error": "No fields to update"}
 
-            response = await client.put(f"/people/{person_id}", json=payload)
+            # Drop fields that already match the recently fetched person, and skip
+            # the write entirely when nothing would change
+            cached = _cache_get(self._person_cache, str(person_id))
+            if cached is not None:
+                current = cached["person"]
+                current_payload = {
+                    "firstName": current["first_name"],
+                    "lastName": current["last_name"],
+                    "phones": [{"value": value} for value in current["phones"]],
+                    "emails": [{"value": value} for value in current["emails"]],
+                }
+                payload = {
+                    field: value
+                    for field, value in payload.items()
+                    if current_payload[field] != value
+                }
+                if not payload:
+                    return {
+                        "success": True,
+                        "person_id": person_id,
+                        "message": "Person already up to date",
+                    }
+
+            response = await client.put(f"/people/{person_id}", content=orjson.dumps(payload))
 
             if response.status_code != HTTPStatus.OK:
                 return {"success": False, "error": f"Failed to update person: {response.text}"}
 
+            self._person_cache.pop(str(person_id), None)
+            self._search_cache.clear()
+
             return {
                 "success": True,
                 "person_id": person_id,
@@ -492,12 +631,12 @@ class FollowUpBossTools:
             if subject:
                 payload["subject"] = subject
 
-            response = await client.post("/notes", json=payload)
+            response = await client.post("/notes", content=orjson.dumps(payload))
 
             if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
                 return {"success": False, "error": f"Failed to add note: {response.text}"}
 
-            note = response.json()
+            note = orjson.loads(response.content)
 
             return {
                 "success": True,
@@ -537,7 +676,7 @@ class FollowUpBossTools:
                 "source": source,
             }
 
-            response = await client.post("/inbox/messages", json=payload)
+            response = await client.post("/inbox/messages", content=orjson.dumps(payload))
 
             if response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
                 self.logger.warning(
@@ -550,7 +689,7 @@ class FollowUpBossTools:
                     "error": f"Failed to send inbox message: {response.text}",
                 }
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return {
                 "success": True,
@@ -628,18 +767,14 @@ class FollowUpBossTools:
         Returns:
             Tool result
         """
-        tool_map: dict[str, ToolHandler] = {
-            "fub_search_person": self.fub_search_person,
-            "fub_get_person": self.fub_get_person,
-            "fub_create_lead": self.fub_create_lead,
-            "fub_create_person": self.fub_create_person,
-            "fub_update_person": self.fub_update_person,
-            "fub_add_note": self.fub_add_note,
-        }
-
-        handler = tool_map.get(tool_name)
+        handler = self._tool_map.get(tool_name)
         if not handler:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
         result: dict[str, Any] = await handler(**arguments)
         return result
+
+
+async def close_shared_clients() -> None:
+    """Close every shared FollowUpBoss HTTP client (called on application shutdown)."""
+    await _client_pool.close_all()
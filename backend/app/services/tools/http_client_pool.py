@@ -0,0 +1,111 @@
+"""Process-wide HTTP client pools shared by integration tool instances."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _SharedClient:
+    """HTTP client shared by every tool instance using the same key."""
+
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    refs: int = 0
+
+
+class SharedClientPool:
+    """HTTP clients keyed by API key so concurrent sessions share one connection pool.
+
+    Each tool instance acquires the client for its key on first use and releases
+    it when the session ends; the client is closed once its last user releases it.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            name: Integration name used in log events
+        """
+        self.name = name
+        self._clients: dict[str, _SharedClient] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a client is currently pooled for a key."""
+        return key in self._clients
+
+    def acquire(
+        self,
+        key: str,
+        current: httpx.AsyncClient | None,
+        build: Callable[[], httpx.AsyncClient],
+    ) -> httpx.AsyncClient:
+        """Get the shared client for a key, creating it on first use.
+
+        The client's connection pool is bound to the event loop that created it,
+        so a new client is built if the shared one belongs to a different loop,
+        and the stale one is closed in the background.
+
+        Args:
+            key: Pool key (the integration's API key)
+            current: Client the caller already holds, if any
+            build: Factory for a new client
+
+        Returns:
+            The shared client; the caller holds a reference until release()
+        """
+        loop = asyncio.get_running_loop()
+        shared = self._clients.get(key)
+        if shared is None or shared.loop is not loop:
+            if shared is not None:
+                self._close_in_background(shared.client)
+            shared = _SharedClient(client=build(), loop=loop)
+            self._clients[key] = shared
+
+        if current is not shared.client:
+            shared.refs += 1
+        return shared.client
+
+    async def release(self, key: str, client: httpx.AsyncClient) -> None:
+        """Release a client from acquire(), closing it once no instance uses it.
+
+        Args:
+            key: Pool key the client was acquired with
+            client: Client returned by acquire()
+        """
+        shared = self._clients.get(key)
+        if shared is None or shared.client is not client:
+            return
+
+        shared.refs -= 1
+        if shared.refs <= 0:
+            del self._clients[key]
+            await client.aclose()
+
+    async def close_all(self) -> None:
+        """Close every shared client (called on application shutdown)."""
+        shared_clients = list(self._clients.values())
+        self._clients.clear()
+        for shared in shared_clients:
+            await shared.client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+    def _close_in_background(self, client: httpx.AsyncClient) -> None:
+        """Close a client replaced after an event loop change without blocking acquire()."""
+        task = asyncio.get_running_loop().create_task(self._aclose_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _aclose_quietly(self, client: httpx.AsyncClient) -> None:
+        """Close a stale client, ignoring errors from its defunct event loop."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("stale_http_client_close_failed", integration=self.name, error=str(e))
@@ -1,7 +1,9 @@
 """Tool registry for managing available tools for voice agents."""
 
+import asyncio
 from typing import Any
 
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.tools.calcom_tools import CalComTools
@@ -13,6 +15,30 @@ from app.services.tools.gohighlevel_tools import GoHighLevelTools
 from app.services.tools.shopify_tools import ShopifyTools
 from app.services.tools.sms_tools import SlickTextSMSTools, TelnyxSMSTools, TwilioSMSTools
 
+logger = structlog.get_logger()
+
+# Tools that only call an external HTTP API and hold no per-session state, so
+# several of them from one assistant message can run at the same time (e.g. a
+# FollowUpBoss person lookup plus a note). CRM tools share the session's
+# AsyncSession and must stay sequential.
+CONCURRENT_TOOL_NAMES = frozenset(
+    {
+        "fub_search_person",
+        "fub_get_person",
+        "fub_create_lead",
+        "fub_create_person",
+        "fub_update_person",
+        "fub_add_note",
+        "calcom_get_event_types",
+        "calcom_get_availability",
+        "calcom_create_booking",
+        "calcom_list_bookings",
+        "calcom_get_booking",
+        "calcom_cancel_booking",
+        "calcom_reschedule_booking",
+    }
+)
+
 
 class ToolRegistry:
     """Registry of all available tools for voice agents.
@@ -43,7 +69,7 @@ class ToolRegistry:
         self.user_id = user_id
         self.integrations = integrations or {}
         self.workspace_id = workspace_id
-        self.crm_tools = CRMTools(db, user_id, workspace_id=workspace_id)
+        self.crm_tools = CRMTools(db, user_id, workspace_id=workspace_id, integrations=integrations)
         self._followupboss_tools: FollowUpBossTools | None = None
         self._ghl_tools: GoHighLevelTools | None = None
         self._calendly_tools: CalendlyTools | None = None
@@ -63,9 +89,6 @@ class ToolRegistry:
 
         # VALIDATION: Require workspace_id for FUB (workspace-only integration)
         if not self.workspace_id:
-            import structlog
-
-            logger = structlog.get_logger()
             logger.warning(
                 "followupboss_requires_workspace",
                 message="FollowUpBoss integration requires workspace_id",
@@ -494,6 +517,58 @@ class ToolRegistry:
         # Unknown tool
         return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
+    async def execute_tools(
+        self, calls: list[tuple[str, dict[str, Any]]], agent_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute the tool calls from one assistant message.
+
+        Tools in CONCURRENT_TOOL_NAMES run concurrently, so the turn waits for the
+        slowest HTTP call rather than their sum. All other tools run one at a
+        time in their original order, alongside the concurrent ones.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+            agent_id: Optional agent UUID for tracking which agent executed the tools
+
+        Returns:
+            Tool results in the same order as ``calls``
+        """
+        results: list[dict[str, Any]] = [{} for _ in calls]
+
+        async def run(index: int) -> None:
+            tool_name, arguments = calls[index]
+            try:
+                results[index] = await self.execute_tool(tool_name, arguments, agent_id=agent_id)
+            except Exception as e:
+                logger.exception("tool_execution_error", tool=tool_name, error=str(e))
+                results[index] = {"success": False, "error": str(e)}
+
+        async def run_in_order(indexes: list[int]) -> None:
+            for index in indexes:
+                await run(index)
+
+        concurrent = [i for i, (name, _) in enumerate(calls) if name in CONCURRENT_TOOL_NAMES]
+        sequential = [i for i, (name, _) in enumerate(calls) if name not in CONCURRENT_TOOL_NAMES]
+        await asyncio.gather(run_in_order(sequential), *(run(i) for i in concurrent))
+        return results
+
+    async def warmup(
+        self,
+        enabled_tools: list[str],
+        agent_settings: dict[str, Any] | None = None,
+    ) -> None:
+        """Pre-open connections for enabled integrations before their first tool call.
+
+        Args:
+            enabled_tools: List of enabled integration IDs
+            agent_settings: Agent-level integration settings, as passed to
+                get_all_tool_definitions()
+        """
+        if "cal-com" in enabled_tools:
+            calcom_tools = self._get_calcom_tools(agent_settings)
+            if calcom_tools:
+                await calcom_tools.warmup()
+
     async def close(self) -> None:
         """Clean up resources."""
         if self._followupboss_tools:
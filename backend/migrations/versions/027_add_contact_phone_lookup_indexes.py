@@ -0,0 +1,43 @@
+"""Add composite indexes for contact lookups by phone number.
+
+Revision ID: 027_add_contact_phone_indexes
+Revises: 7daa5cef25ce
+Create Date: 2025-12-22
+
+Voice and SMS booking resolves the caller's contact by phone number within
+a workspace (or within a user's contacts for legacy data). The single-column
+phone_number index forces a filter over every workspace sharing a number;
+these composite indexes turn the lookup into a single index probe.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "027_add_contact_phone_indexes"
+down_revision: str | None = "7daa5cef25ce"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite indexes for scoped phone number lookups."""
+    op.create_index(
+        "ix_contacts_workspace_id_phone_number",
+        "contacts",
+        ["workspace_id", "phone_number"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_contacts_user_id_phone_number",
+        "contacts",
+        ["user_id", "phone_number"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove scoped phone number lookup indexes."""
+    op.drop_index("ix_contacts_user_id_phone_number", table_name="contacts")
+    op.drop_index("ix_contacts_workspace_id_phone_number", table_name="contacts")
@@ -0,0 +1,43 @@
+"""Add trigram indexes for contact search.
+
+Revision ID: 028_add_contact_search_trgm
+Revises: 027_add_contact_phone_indexes
+Create Date: 2025-12-23
+
+The search_customer tool matches names and emails with ILIKE prefixes and
+phone numbers with ILIKE substrings, none of which a btree index can serve,
+so every search scanned the workspace's contacts. pg_trgm GIN indexes on the
+searched columns let Postgres answer each ILIKE branch with a bitmap index scan.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "028_add_contact_search_trgm"
+down_revision: str | None = "027_add_contact_phone_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_COLUMNS = ("first_name", "last_name", "email", "phone_number")
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add trigram indexes on searched contact columns."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_contacts_{column}_trgm",
+            "contacts",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Remove contact search trigram indexes."""
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f"ix_contacts_{column}_trgm", table_name="contacts")
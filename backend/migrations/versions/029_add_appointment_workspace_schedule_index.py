@@ -0,0 +1,39 @@
+"""Add composite index for workspace appointment schedules.
+
+Revision ID: 029_add_appointment_ws_schedule
+Revises: 028_add_contact_search_trgm
+Create Date: 2025-12-23
+
+Appointment listings filter by workspace and status and then order or
+range-filter on scheduled_at. Only single-column indexes covered these
+filters, so Postgres had to intersect them or filter after the fact.
+Equality columns come first so the scheduled_at range is read in index order.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "029_add_appointment_ws_schedule"
+down_revision: str | None = "028_add_contact_search_trgm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add workspace/status/schedule index on appointments."""
+    op.create_index(
+        "ix_appointments_workspace_id_status_scheduled_at",
+        "appointments",
+        ["workspace_id", "status", "scheduled_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove workspace/status/schedule index on appointments."""
+    op.drop_index(
+        "ix_appointments_workspace_id_status_scheduled_at",
+        table_name="appointments",
+    )
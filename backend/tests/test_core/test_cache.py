@@ -9,7 +9,9 @@ from app.core.cache import (
     cache_delete,
     cache_get,
     cache_invalidate,
+    cache_invalidate_index,
     cache_set,
+    cache_set_indexed,
     cache_stats,
     cached,
 )
@@ -226,6 +228,44 @@ class TestCacheInvalidate:
             assert result == 0
 
 
+class TestCacheIndex:
+    """Test index-tracked cache keys."""
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidate_index_deletes_indexed_keys(self) -> None:
+        """Test that only keys recorded in the index are invalidated."""
+        await cache_set_indexed("crm:contacts:list:1:all:0:50", [1], "crm:contacts:list:1:keys")
+        await cache_set_indexed("crm:contacts:list:1:all:50:50", [2], "crm:contacts:list:1:keys")
+        await cache_set_indexed("crm:contacts:list:2:all:0:50", [3], "crm:contacts:list:2:keys")
+
+        deleted_count = await cache_invalidate_index("crm:contacts:list:1:keys")
+
+        assert deleted_count == 2
+        assert await cache_get("crm:contacts:list:1:all:0:50") is None
+        assert await cache_get("crm:contacts:list:1:all:50:50") is None
+        assert await cache_get("crm:contacts:list:2:all:0:50") == [3]
+        assert await cache_invalidate_index("crm:contacts:list:1:keys") == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_set_indexed_applies_ttl_to_index(self, test_redis: Any) -> None:
+        """Test that the index expires along with its keys."""
+        await cache_set_indexed("test:key", "value", "test:keys", ttl=60)
+
+        assert 0 < await test_redis.ttl("test:key") <= 60
+        assert 0 < await test_redis.ttl("test:keys") <= 60
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidate_index_error_handling(self) -> None:
+        """Test cache_invalidate_index handles Redis errors gracefully."""
+        with patch("app.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.smembers = AsyncMock(side_effect=Exception("Redis error"))
+            mock_get_redis.return_value = mock_redis
+
+            result = await cache_invalidate_index("test:keys")
+            assert result == 0
+
+
 class TestCachedDecorator:
     """Test the @cached decorator."""
 
@@ -0,0 +1,446 @@
+"""Tests for Cal.com tools."""
+
+# ruff: noqa: SLF001
+
+import asyncio
+import json
+from collections.abc import Callable
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog.testing import capture_logs
+
+from app.services.tools import calcom_tools
+from app.services.tools.calcom_tools import CalComTools, close_shared_clients
+from app.services.tools.registry import ToolRegistry
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+EVENT_TYPES_RESPONSE = {
+    "data": [
+        {"id": 101, "title": "Consultation", "slug": "consultation", "lengthInMinutes": 30},
+        {"id": 202, "slug": "intro-call", "lengthInMinutes": 15},
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+async def reset_shared_clients():
+    """Ensure every test starts and ends without pooled clients."""
+    await close_shared_clients()
+    yield
+    await close_shared_clients()
+
+
+@pytest.fixture
+def make_tools(monkeypatch):
+    """Factory for CalComTools whose HTTP client is served by a mock handler."""
+
+    def factory(handler: Handler) -> CalComTools:
+        tools = CalComTools(api_key="cal_key_mock", event_type_id=101)
+        client = httpx.AsyncClient(
+            base_url=CalComTools.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(CalComTools, "_build_client", lambda _self: client)
+        return tools
+
+    return factory
+
+
+class TestCalComCaching:
+    """Tests for short-lived response caches."""
+
+    @pytest.mark.asyncio
+    async def test_get_event_types_is_cached(self, make_tools):
+        """Test that repeated event type lookups hit the API once."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        tools = make_tools(handler)
+        first = await tools.get_event_types()
+        second = await tools.get_event_types()
+
+        assert first["success"] is True
+        assert [et["id"] for et in first["event_types"]] == [101, 202]
+        assert second == first
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_mutating_a_result_does_not_corrupt_the_cache(self, make_tools):
+        """Test that callers trimming a returned list don't change later results."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                return httpx.Response(
+                    200,
+                    json={"data": {"slots": {"2025-01-20": [{"time": "2025-01-20T10:00:00Z"}]}}},
+                )
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        tools = make_tools(handler)
+        first_types = await tools.get_event_types()
+        first_types["event_types"].clear()
+        first_slots = await tools.get_availability(101, "2025-01-20", "2025-01-20")
+        first_slots["available_slots"].append({"start_time": "bogus"})
+        first_slots["total"] = 0
+
+        second_types = await tools.get_event_types()
+        second_slots = await tools.get_availability(101, "2025-01-20", "2025-01-20")
+
+        assert [et["id"] for et in second_types["event_types"]] == [101, 202]
+        assert second_slots["available_slots"] == [
+            {"start_time": "2025-01-20T10:00:00Z", "duration_minutes": 30}
+        ]
+        assert second_slots["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_event_types_error_is_not_cached(self, make_tools):
+        """Test that failed lookups are retried on the next call."""
+        responses = [
+            httpx.Response(500, text="boom"),
+            httpx.Response(200, json=EVENT_TYPES_RESPONSE),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        tools = make_tools(handler)
+
+        assert await tools.get_event_types() == {
+            "success": False,
+            "error": "Failed to get event types: boom",
+        }
+        assert (await tools.get_event_types())["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_booking_invalidates_cached_availability(self, make_tools):
+        """Test that creating a booking forces availability to be re-fetched."""
+        slot_requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                slot_requests.append(request)
+                return httpx.Response(
+                    200,
+                    json={"data": {"slots": {"2025-01-20": [{"time": "2025-01-20T10:00:00Z"}]}}},
+                )
+            if request.url.path.endswith("/bookings"):
+                return httpx.Response(201, json={"data": {"uid": "abc", "id": 1}})
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        tools = make_tools(handler)
+        await tools.get_availability(101, "2025-01-20", "2025-01-20")
+        await tools.get_availability(101, "2025-01-20", "2025-01-20")
+        assert len(slot_requests) == 1
+
+        await tools.create_booking(
+            event_type_id=101,
+            start_time="2025-01-20T10:00:00Z",
+            attendee_email="jane@example.com",
+            attendee_name="Jane Doe",
+        )
+        await tools.get_availability(101, "2025-01-20", "2025-01-20")
+        assert len(slot_requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_availability_requests_are_coalesced(self, make_tools):
+        """Test that identical in-flight availability lookups share one request."""
+        slot_requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                slot_requests.append(request)
+                return httpx.Response(200, json={"data": {"slots": {}}})
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        tools = make_tools(handler)
+        results = await asyncio.gather(
+            *(tools.get_availability(101, "2025-01-20", "2025-01-21") for _ in range(3))
+        )
+
+        assert all(result["success"] for result in results)
+        assert len(slot_requests) == 1
+        assert calcom_tools._inflight_availability == {}
+
+    @pytest.mark.asyncio
+    async def test_availability_requests_are_coalesced_across_sessions(self, make_tools):
+        """Test that two sessions on the same account share one in-flight lookup."""
+        slot_requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                slot_requests.append(request)
+                return httpx.Response(200, json={"data": {"slots": {}}})
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        first_session = make_tools(handler)
+        second_session = make_tools(handler)
+        results = await asyncio.gather(
+            first_session.get_availability(101, "2025-01-20", "2025-01-21"),
+            second_session.get_availability(101, "2025-01-20", "2025-01-21"),
+        )
+
+        assert all(result["success"] for result in results)
+        assert len(slot_requests) == 1
+        assert calcom_tools._inflight_availability == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_lookup_survives_the_starting_session_closing(
+        self, make_tools, monkeypatch
+    ):
+        """Test that a coalesced lookup keeps its client after the first session ends."""
+        monkeypatch.setattr(calcom_tools, "RETRY_BACKOFF_SECONDS", 0.0)
+        slot_started = asyncio.Event()
+        release_slots = asyncio.Event()
+        slot_responses = [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json={"data": {"slots": {}}}),
+        ]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                slot_started.set()
+                await release_slots.wait()
+                return slot_responses.pop(0)
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        first_session = make_tools(handler)
+        second_session = make_tools(handler)
+        first = asyncio.ensure_future(
+            first_session.get_availability(101, "2025-01-20", "2025-01-20")
+        )
+        await slot_started.wait()
+        second = asyncio.ensure_future(
+            second_session.get_availability(101, "2025-01-20", "2025-01-20")
+        )
+
+        # The retry after the 503 goes out after the first session has closed
+        await first_session.close()
+        release_slots.set()
+
+        assert (await second)["success"] is True
+        assert (await first)["success"] is True
+        assert slot_responses == []
+        assert "cal_key_mock" not in calcom_tools._client_pool
+
+    @pytest.mark.asyncio
+    async def test_expired_event_types_revalidate_with_etag(self, make_tools, monkeypatch):
+        """Test that an expired cache is revalidated and reused on 304."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE, headers={"ETag": '"v1"'})
+
+        tools = make_tools(handler)
+        first = await tools.get_event_types()
+
+        monkeypatch.setattr(calcom_tools, "EVENT_TYPES_CACHE_TTL_SECONDS", 0.0)
+        second = await tools.get_event_types()
+
+        assert second == first
+        assert len(requests) == 2
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+class TestCalComAvailability:
+    """Tests for availability lookups."""
+
+    @pytest.mark.asyncio
+    async def test_slots_use_event_type_duration(self, make_tools):
+        """Test that slot durations come from the event type, not its ID."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "data": {
+                            "slots": {
+                                "2025-01-20": [{"time": "2025-01-20T10:00:00Z"}],
+                                "2025-01-21": [{"time": "2025-01-21T09:00:00Z"}],
+                            }
+                        }
+                    },
+                )
+            return httpx.Response(200, json=EVENT_TYPES_RESPONSE)
+
+        tools = make_tools(handler)
+        result = await tools.get_availability(101, "2025-01-20", "2025-01-21")
+
+        assert result["total"] == 2
+        assert [slot["duration_minutes"] for slot in result["available_slots"]] == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_event_types_failure_is_logged(self, make_tools):
+        """Test that slots are still returned, with a warning, when event types fail."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/slots/"):
+                return httpx.Response(
+                    200,
+                    json={"data": {"slots": {"2025-01-20": [{"time": "2025-01-20T10:00:00Z"}]}}},
+                )
+            return httpx.Response(401, text="unauthorized")
+
+        tools = make_tools(handler)
+        with capture_logs() as logs:
+            result = await tools.get_availability(101, "2025-01-20", "2025-01-20")
+
+        assert result["success"] is True
+        assert result["available_slots"] == [
+            {"start_time": "2025-01-20T10:00:00Z", "duration_minutes": None}
+        ]
+        warning = next(
+            log for log in logs if log["event"] == "calcom_availability_missing_durations"
+        )
+        assert warning["log_level"] == "warning"
+        assert warning["event_type_id"] == 101
+        assert warning["error"] == "Failed to get event types: unauthorized"
+
+
+class TestCalComBookings:
+    """Tests for booking requests."""
+
+    @pytest.mark.asyncio
+    async def test_create_booking_sends_json_payload(self, make_tools):
+        """Test that the booking payload is sent as a JSON body."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(201, json={"data": {"uid": "abc", "id": 1}})
+
+        tools = make_tools(handler)
+        result = await tools.create_booking(
+            event_type_id=101,
+            start_time="2025-01-20T10:00:00Z",
+            attendee_email="jane@example.com",
+            attendee_name="Jane Doe",
+            notes="Prefers mornings",
+        )
+
+        assert result["success"] is True
+        assert result["booking"]["uid"] == "abc"
+        assert json.loads(sent[0].content) == {
+            "start": "2025-01-20T10:00:00Z",
+            "eventTypeId": 101,
+            "attendee": {"name": "Jane Doe", "email": "jane@example.com", "timeZone": "UTC"},
+            "metadata": {"notes": "Prefers mornings"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_booking_retries_transient_errors(self, make_tools, monkeypatch):
+        """Test that idempotent requests are retried on gateway errors."""
+        monkeypatch.setattr(calcom_tools, "RETRY_BACKOFF_SECONDS", 0.0)
+        responses = [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json={"data": {"uid": "abc", "attendees": []}}),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        tools = make_tools(handler)
+        result = await tools.get_booking("abc")
+
+        assert result["success"] is True
+        assert result["booking"]["uid"] == "abc"
+        assert responses == []
+
+    @pytest.mark.asyncio
+    async def test_create_booking_is_not_retried_on_error_status(self, make_tools):
+        """Test that bookings are never re-sent after the server responded."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(503, text="unavailable")
+
+        tools = make_tools(handler)
+        result = await tools.create_booking(
+            event_type_id=101,
+            start_time="2025-01-20T10:00:00Z",
+            attendee_email="jane@example.com",
+            attendee_name="Jane Doe",
+        )
+
+        assert result == {"success": False, "error": "Failed to create booking: unavailable"}
+        assert len(sent) == 1
+
+
+class TestCalComWarmup:
+    """Tests for warming the Cal.com connection at session start."""
+
+    @pytest.mark.asyncio
+    async def test_registry_warmup_does_not_depend_on_definitions(
+        self, make_tools, test_session: AsyncSession
+    ):
+        """Test that warmup opens the connection before tool definitions are built."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        make_tools(handler)
+        registry = ToolRegistry(
+            test_session, user_id=1, integrations={"cal-com": {"api_key": "cal_key_mock"}}
+        )
+
+        await registry.warmup([])
+        assert requests == []
+
+        await registry.warmup(["cal-com"], {"cal-com": {"default_event_type_id": 202}})
+        assert [request.method for request in requests] == ["HEAD"]
+        calcom = registry._get_calcom_tools()
+        assert calcom is not None
+        assert calcom.event_type_id == 202
+        await registry.close()
+
+
+class TestCalComConcurrentDispatch:
+    """Tests for running several Cal.com tool calls from one turn together."""
+
+    @pytest.mark.asyncio
+    async def test_registry_runs_calcom_calls_concurrently(
+        self, make_tools, test_session: AsyncSession
+    ):
+        """Test that Cal.com calls overlap and results keep the call order."""
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            uid = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"data": {"uid": uid, "attendees": []}})
+
+        make_tools(handler)
+        registry = ToolRegistry(
+            test_session, user_id=1, integrations={"cal-com": {"api_key": "cal_key_mock"}}
+        )
+
+        results = await registry.execute_tools(
+            [
+                ("calcom_get_booking", {"booking_uid": "first"}),
+                ("not_a_tool", {}),
+                ("calcom_get_booking", {"booking_uid": "second"}),
+            ]
+        )
+
+        assert peak == 2
+        assert results[0]["booking"]["uid"] == "first"
+        assert results[1] == {"success": False, "error": "Unknown tool: not_a_tool"}
+        assert results[2]["booking"]["uid"] == "second"
+        await registry.close()
@@ -0,0 +1,898 @@
+"""Tests for CRM tools."""
+
+# ruff: noqa: SLF001
+
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import user_id_to_uuid
+from app.models.appointment import Appointment
+from app.models.calendar_sync import CalendarSyncQueue
+from app.models.contact import Contact
+from app.models.workspace import Workspace
+from app.services.tools.crm_tools import (
+    CRMTools,
+    UtcTimestamp,
+    format_appointment_time,
+    parse_ymd,
+    resolve_date_expression,
+)
+
+
+@pytest_asyncio.fixture
+async def workspace(test_session: AsyncSession, create_test_user: Any) -> Workspace:
+    """Create a workspace with a configured timezone."""
+    user = await create_test_user()
+    workspace = Workspace(
+        id=uuid.uuid4(),
+        name="Test Workspace",
+        user_id=user.id,
+        is_default=True,
+        settings={"timezone": "America/New_York"},
+    )
+    test_session.add(workspace)
+    await test_session.commit()
+    await test_session.refresh(workspace)
+    return workspace
+
+
+@pytest_asyncio.fixture
+async def contact(test_session: AsyncSession, workspace: Workspace) -> Contact:
+    """Create a contact scoped to the test workspace."""
+    contact = Contact(
+        user_id=workspace.user_id,
+        workspace_id=workspace.id,
+        first_name="Jane",
+        last_name="Smith",
+        email="jane@example.com",
+        phone_number="+15551234567",
+        status="new",
+    )
+    test_session.add(contact)
+    await test_session.commit()
+    await test_session.refresh(contact)
+    return contact
+
+
+@pytest_asyncio.fixture
+async def appointment(test_session: AsyncSession, contact: Contact) -> Appointment:
+    """Create a scheduled appointment for the test contact."""
+    appointment = Appointment(
+        contact_id=contact.id,
+        workspace_id=contact.workspace_id,
+        scheduled_at=datetime.now(UTC) + timedelta(days=1),
+        duration_minutes=30,
+        notes="Initial consultation",
+        status="scheduled",
+    )
+    test_session.add(appointment)
+    await test_session.commit()
+    return appointment
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (datetime(2030, 1, 5, 0, 7), "January 05 at 12:07 AM"),
+        (datetime(2030, 12, 25, 12, 0), "December 25 at 12:00 PM"),
+        (datetime(2030, 7, 4, 14, 30), "July 04 at 02:30 PM"),
+    ],
+)
+def test_format_appointment_time(value: datetime, expected: str) -> None:
+    """Test that appointment times match the %B %d at %I:%M %p format."""
+    assert format_appointment_time(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("tomorrow at 3pm", (date(2030, 1, 16), 15, 0)),
+        ("friday 9:30am", (date(2030, 1, 18), 9, 30)),
+        ("next friday at 12pm", (date(2030, 1, 25), 12, 0)),
+        ("tuesday", (date(2030, 1, 22), 9, 0)),
+        ("2030-02-01 at 12am", (date(2030, 2, 1), 0, 0)),
+    ],
+)
+def test_resolve_date_expression(text: str, expected: tuple[date, int, int]) -> None:
+    """Test relative and absolute expressions against a fixed Tuesday."""
+    assert resolve_date_expression(text, date(2030, 1, 15)) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2030-01-05", datetime(2030, 1, 5)),
+        ("2030-1-5", datetime(2030, 1, 5)),
+        ("2030-12-5", datetime(2030, 12, 5)),
+    ],
+)
+def test_parse_ymd(value: str, expected: datetime) -> None:
+    """Test that padded and unpadded YYYY-MM-DD dates parse to midnight."""
+    assert parse_ymd(value) == expected
+
+
+@pytest.mark.parametrize("value", ["2030-01-15T10:00", "20300115", "2030-W03-2"])
+def test_parse_ymd_rejects_other_forms(value: str) -> None:
+    """Test that times, basic dates and week dates are refused."""
+    with pytest.raises(ValueError, match="expected YYYY-MM-DD"):
+        parse_ymd(value)
+
+
+@pytest.mark.parametrize("value", ["2030-02-30", "2030-2-30"])
+def test_parse_ymd_rejects_impossible_dates(value: str) -> None:
+    """Test that out-of-range days fail on both the padded and unpadded paths."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        parse_ymd(value)
+
+
+def test_utc_timestamp_ignores_postgres_session_timezone() -> None:
+    """Test that hours are extracted in UTC on Postgres and from the raw column on SQLite."""
+    hour = func.extract("hour", UtcTimestamp(Appointment.scheduled_at))
+
+    assert "EXTRACT(hour FROM timezone(" in str(hour.compile(dialect=postgresql.dialect()))
+    assert str(hour.compile(dialect=sqlite.dialect())) == (
+        "CAST(STRFTIME('%H', appointments.scheduled_at) AS INTEGER)"
+    )
+
+
+class TestCalendarSyncEnqueue:
+    """Tests for queuing appointments for external calendar sync."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_skips_providers_already_queued(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that only connected providers without a pending sync are queued."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        integrations = {"cal-com": {"api_key": "key"}, "google-calendar": {"token": "t"}}
+
+        with patch(
+            "app.services.tools.crm_tools.get_workspace_integrations",
+            AsyncMock(return_value=integrations),
+        ):
+            await crm_tools._enqueue_calendar_sync(appointment, operation="create")
+            await crm_tools._enqueue_calendar_sync(appointment, operation="create")
+
+        result = await test_session.execute(
+            select(CalendarSyncQueue.calendar_provider).where(
+                CalendarSyncQueue.appointment_id == appointment.id
+            )
+        )
+        assert sorted(result.scalars()) == ["cal-com", "google-calendar"]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_reuses_session_integrations(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that integrations passed at construction are not fetched again."""
+        crm_tools = CRMTools(
+            db=test_session,
+            user_id=workspace.user_id,
+            workspace_id=workspace.id,
+            integrations={"calendly": {"api_key": "key"}},
+        )
+        fetch = AsyncMock(return_value={})
+
+        with patch("app.services.tools.crm_tools.get_workspace_integrations", fetch):
+            await crm_tools._enqueue_calendar_sync(appointment, operation="update")
+
+        fetch.assert_not_awaited()
+        result = await test_session.execute(select(CalendarSyncQueue.calendar_provider))
+        assert list(result.scalars()) == ["calendly"]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_uses_cached_calendar_providers(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that cached provider names skip the integrations query."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        fetch = AsyncMock(return_value={})
+
+        with (
+            patch("app.services.tools.crm_tools.get_workspace_integrations", fetch),
+            patch(
+                "app.services.tools.crm_tools.cache_get", AsyncMock(return_value=["cal-com"])
+            ) as cache_get,
+        ):
+            await crm_tools._enqueue_calendar_sync(appointment, operation="create")
+
+        fetch.assert_not_awaited()
+        cache_get.assert_awaited_once_with(
+            f"integrations:calendar_providers:{user_id_to_uuid(workspace.user_id)}:{workspace.id}"
+        )
+        result = await test_session.execute(select(CalendarSyncQueue.calendar_provider))
+        assert list(result.scalars()) == ["cal-com"]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_caches_provider_names_only(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that a cache miss stores provider names rather than credentials."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        integrations = {"google-calendar": {"token": "t"}, "followupboss": {"api_key": "k"}}
+        store = AsyncMock(return_value=True)
+
+        with (
+            patch(
+                "app.services.tools.crm_tools.get_workspace_integrations",
+                AsyncMock(return_value=integrations),
+            ),
+            patch("app.services.tools.crm_tools.cache_get", AsyncMock(return_value=None)),
+            patch("app.services.tools.crm_tools.cache_set_indexed", store),
+        ):
+            await crm_tools._enqueue_calendar_sync(appointment, operation="create")
+
+        assert store.await_args is not None
+        assert store.await_args.args[1] == ["google-calendar"]
+
+
+class TestCheckAvailability:
+    """Tests for hourly availability lookups."""
+
+    @pytest.mark.asyncio
+    async def test_booked_hours_are_excluded(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that slots with a scheduled appointment are not offered."""
+        test_session.add_all(
+            [
+                Appointment(
+                    contact_id=contact.id,
+                    workspace_id=workspace.id,
+                    scheduled_at=datetime(2030, 1, 15, 10, 0),
+                    status="scheduled",
+                ),
+                Appointment(
+                    contact_id=contact.id,
+                    workspace_id=workspace.id,
+                    scheduled_at=datetime(2030, 1, 15, 14, 0),
+                    status="cancelled",
+                ),
+            ]
+        )
+        await test_session.commit()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.check_availability("2030-01-15")
+
+        assert result["success"] is True
+        assert "2030-01-15T10:00:00" not in result["available_slots"]
+        assert "2030-01-15T14:00:00" in result["available_slots"]
+        assert result["total_available"] == 7
+
+        unpadded = await crm_tools.check_availability("2030-1-15")
+        assert unpadded["available_slots"] == result["available_slots"]
+
+    @pytest.mark.asyncio
+    async def test_ignores_other_workspaces_bookings(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that only appointments recorded in the tool's workspace block slots."""
+        test_session.add(
+            Appointment(
+                contact_id=contact.id,
+                workspace_id=None,
+                scheduled_at=datetime(2030, 1, 15, 10, 0),
+                status="scheduled",
+            )
+        )
+        await test_session.commit()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.check_availability("2030-01-15")
+
+        assert "2030-01-15T10:00:00" in result["available_slots"]
+
+
+class TestSearchCustomer:
+    """Tests for contact search."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query", ["Jane", "smi", "jane@", "5551234567", "(555) 123-4567", "Jane Smith"]
+    )
+    async def test_search_matches_contact(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+        query: str,
+    ) -> None:
+        """Test that name, email, phone and full name queries find the contact."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.search_customer(query)
+
+        assert result["found"] is True
+        assert result["customers"][0]["id"] == contact.id
+
+    @pytest.mark.asyncio
+    async def test_search_returns_at_most_three_contacts(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that the result count is capped to the newest contacts."""
+        test_session.add_all(
+            [
+                Contact(
+                    user_id=workspace.user_id,
+                    workspace_id=workspace.id,
+                    first_name="Alex",
+                    phone_number=f"+1555000000{i}",
+                )
+                for i in range(5)
+            ]
+        )
+        await test_session.commit()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.search_customer("alex")
+
+        assert result["count"] == 3
+        assert [c["phone"] for c in result["customers"]] == [
+            "+15550000004",
+            "+15550000003",
+            "+15550000002",
+        ]
+
+
+class TestParseDate:
+    """Tests for natural language date parsing."""
+
+    @pytest.mark.asyncio
+    async def test_parse_date_uses_workspace_timezone(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that expressions resolve in the workspace's timezone."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.parse_date("tomorrow at 3pm")
+
+        assert result["success"] is True
+        assert result["timezone"] == "America/New_York"
+        parsed = datetime.fromisoformat(result["parsed_datetime"])
+        assert (parsed.hour, parsed.minute) == (15, 0)
+        assert parsed.utcoffset() in (timedelta(hours=-5), timedelta(hours=-4))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("expression", "min_days", "max_days"),
+        [("friday at 9am", 1, 7), ("Next Friday, 9am", 7, 13)],
+    )
+    async def test_parse_date_resolves_weekdays(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        expression: str,
+        min_days: int,
+        max_days: int,
+    ) -> None:
+        """Test that day names resolve to the upcoming (or following) occurrence."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.parse_date(expression)
+
+        parsed = datetime.fromisoformat(result["parsed_datetime"])
+        today = datetime.now(parsed.tzinfo).date()
+        assert parsed.weekday() == 4
+        assert parsed.hour == 9
+        assert min_days <= (parsed.date() - today).days <= max_days
+
+    @pytest.mark.asyncio
+    async def test_workspace_timezone_is_loaded_once(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that repeated parses reuse the timezone loaded on first use."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        await crm_tools.parse_date("friday at 9am")
+
+        workspace.settings = {"timezone": "Asia/Tokyo"}
+        await test_session.commit()
+        result = await crm_tools.parse_date("friday at 9am")
+
+        assert result["timezone"] == "America/New_York"
+
+    @pytest.mark.asyncio
+    async def test_workspace_timezone_served_from_cache(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that a cached timezone is used without reading the workspace."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        with patch(
+            "app.services.tools.crm_tools.cache_get",
+            AsyncMock(return_value={"timezone": "Asia/Tokyo"}),
+        ) as cache_get:
+            result = await crm_tools.parse_date("tomorrow at 3pm")
+
+        cache_get.assert_awaited_once_with(f"workspace:timezone:{workspace.id}")
+        assert result["timezone"] == "Asia/Tokyo"
+
+
+class TestBookAppointment:
+    """Tests for booking appointments."""
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_with_duplicate_phone_contacts(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that a duplicated phone number still books against one contact."""
+        test_session.add(
+            Contact(
+                user_id=workspace.user_id,
+                workspace_id=workspace.id,
+                first_name="Jane",
+                phone_number=contact.phone_number,
+            )
+        )
+        await test_session.commit()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.book_appointment(
+            contact_phone=contact.phone_number,
+            scheduled_at=(datetime.now(UTC) + timedelta(days=2)).isoformat(),
+        )
+
+        assert result["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_commits_calendar_sync_entries(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that sync entries are committed together with the new appointment."""
+        crm_tools = CRMTools(
+            db=test_session,
+            user_id=workspace.user_id,
+            workspace_id=workspace.id,
+            integrations={"cal-com": {"api_key": "key"}},
+        )
+
+        result = await crm_tools.book_appointment(
+            contact_phone=contact.phone_number,
+            scheduled_at=(datetime.now(UTC) + timedelta(days=2)).isoformat(),
+        )
+        await test_session.rollback()
+
+        queued = await test_session.execute(
+            select(CalendarSyncQueue.appointment_id, CalendarSyncQueue.operation)
+        )
+        assert queued.all() == [(result["appointment_id"], "create")]
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_survives_failed_provider_lookup(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that a failing integrations query is isolated from the booking."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        in_savepoint: list[bool] = []
+
+        async def failing_lookup(**kwargs: Any) -> dict[str, dict[str, Any]]:
+            in_savepoint.append(test_session.in_nested_transaction())
+            raise RuntimeError("integrations query failed")
+
+        with patch("app.services.tools.crm_tools.get_workspace_integrations", failing_lookup):
+            result = await crm_tools.book_appointment(
+                contact_phone=contact.phone_number,
+                scheduled_at=(datetime.now(UTC) + timedelta(days=2)).isoformat(),
+            )
+        await test_session.rollback()
+
+        assert result["success"] is True
+        assert in_savepoint == [True]
+        stored = await test_session.scalar(
+            select(Appointment.id).where(Appointment.id == result["appointment_id"])
+        )
+        assert stored == result["appointment_id"]
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_accepts_z_suffix(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that a trailing Z is parsed as UTC."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        scheduled = (datetime.now(UTC) + timedelta(days=2)).replace(microsecond=0)
+
+        result = await crm_tools.book_appointment(
+            contact_phone=contact.phone_number,
+            scheduled_at=scheduled.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+        assert result["success"] is True
+        appointment = await test_session.get(Appointment, result["appointment_id"])
+        assert appointment is not None
+        assert appointment.scheduled_at.replace(tzinfo=UTC) == scheduled
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_reuses_loaded_workspace_timezone(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that naive times don't reload the timezone already loaded by parse_date."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        await crm_tools.parse_date("tomorrow at 3pm")
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = test_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await crm_tools.book_appointment(
+                contact_phone=contact.phone_number,
+                scheduled_at="2030-01-15T10:00:00",
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result["success"] is True
+        assert not [sql for sql in statements if "FROM workspaces" in sql]
+
+    @pytest.mark.asyncio
+    async def test_book_naive_datetime_reads_timezone_with_contact(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that the workspace timezone comes from the contact lookup query."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = test_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with patch(
+                "app.services.tools.crm_tools.cache_get", AsyncMock(return_value=None)
+            ) as cache_get:
+                result = await crm_tools.book_appointment(
+                    contact_phone=contact.phone_number,
+                    scheduled_at="2030-01-15T10:00:00",
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result["success"] is True
+        assert not [c for c in cache_get.await_args_list if "timezone" in c.args[0]]
+        assert not [sql for sql in statements if "FROM workspaces" in sql]
+        appointment = await test_session.get(Appointment, result["appointment_id"])
+        assert appointment is not None
+        assert appointment.scheduled_at == datetime(2030, 1, 15, 15, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_book_naive_datetime_without_workspace(
+        self,
+        test_session: AsyncSession,
+        create_test_user: Any,
+    ) -> None:
+        """Test that naive times without a workspace are validated as UTC."""
+        user = await create_test_user()
+        crm_tools = CRMTools(db=test_session, user_id=user.id)
+
+        result = await crm_tools.book_appointment(
+            contact_phone="+15557654321",
+            scheduled_at="2030-01-15T10:00:00",
+        )
+
+        assert result["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_book_appointment_invalidates_owner_stats(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that booking clears only the contact owner's cached stats."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        owner_id, phone_number = contact.user_id, contact.phone_number
+        delete = AsyncMock(return_value=True)
+        # Start from an empty identity map, as a fresh request session would
+        test_session.expunge_all()
+
+        with patch("app.services.tools.crm_tools.cache_delete", delete):
+            result = await crm_tools.book_appointment(
+                contact_phone=phone_number,
+                scheduled_at=(datetime.now(UTC) + timedelta(days=2)).isoformat(),
+            )
+
+        assert result["success"] is True
+        delete.assert_awaited_once_with(f"crm:stats:{owner_id}")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scheduled_at", ["2020-01-15T10:00:00", "2020-01-15T10:00:00Z"])
+    async def test_book_appointment_rejects_past_times(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+        scheduled_at: str,
+    ) -> None:
+        """Test that naive and aware times in the past are refused."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.book_appointment(
+            contact_phone=contact.phone_number, scheduled_at=scheduled_at
+        )
+
+        assert result["success"] is False
+        assert result["error"].startswith("Cannot book appointment in the past")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("scheduled_at", "agent_id"),
+        [
+            ("2020-01-15T10:00:00Z", None),
+            ("not-a-date", None),
+            ((datetime.now(UTC) + timedelta(days=2)).isoformat(), "not-a-uuid"),
+        ],
+    )
+    async def test_failed_booking_leaves_no_auto_created_contact(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        scheduled_at: str,
+        agent_id: str | None,
+    ) -> None:
+        """Test that a rejected booking for an unknown phone saves no contact later."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.book_appointment(
+            contact_phone="+15550000000", scheduled_at=scheduled_at, agent_id=agent_id
+        )
+        # The next tool call to commit on the shared session must not save it
+        await test_session.commit()
+
+        assert result["success"] is False
+        contacts = await test_session.scalars(
+            select(Contact.id).where(Contact.phone_number == "+15550000000")
+        )
+        assert list(contacts) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_rolls_back_session(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that a failed commit discards the booking and leaves the session usable."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        with patch.object(test_session, "commit", AsyncMock(side_effect=RuntimeError("boom"))):
+            result = await crm_tools.book_appointment(
+                contact_phone="+15550000000",
+                scheduled_at=(datetime.now(UTC) + timedelta(days=2)).isoformat(),
+            )
+        await test_session.commit()
+
+        assert result["success"] is False
+        assert await test_session.scalar(select(func.count(Appointment.id))) == 0
+        assert await test_session.scalar(select(func.count(Contact.id))) == 0
+
+
+class TestModifyAppointment:
+    """Tests for cancelling and rescheduling appointments."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_appends_reason_to_notes(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that cancelling loads the deferred notes and records the reason."""
+        appointment_id = appointment.id
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        test_session.expire_all()
+
+        result = await crm_tools.cancel_appointment(appointment_id, reason="Feeling better")
+
+        assert result["success"] is True
+        notes = await test_session.scalar(
+            select(Appointment.notes).where(Appointment.id == appointment_id)
+        )
+        assert notes == "Initial consultation\n\nCancellation reason: Feeling better"
+
+    @pytest.mark.asyncio
+    async def test_cancel_ignores_other_workspaces(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that an appointment outside the tool's workspace is not cancelled."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=uuid.uuid4())
+
+        result = await crm_tools.cancel_appointment(appointment.id)
+
+        assert result == {"success": False, "error": f"Appointment {appointment.id} not found"}
+        status = await test_session.scalar(
+            select(Appointment.status).where(Appointment.id == appointment.id)
+        )
+        assert status == "scheduled"
+
+    @pytest.mark.asyncio
+    async def test_reschedule_queues_calendar_update(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        appointment: Appointment,
+    ) -> None:
+        """Test that rescheduling queues an update with the appointment's notes."""
+        appointment_id = appointment.id
+        crm_tools = CRMTools(
+            db=test_session,
+            user_id=workspace.user_id,
+            workspace_id=workspace.id,
+            integrations={"cal-com": {"api_key": "key"}},
+        )
+        new_time = datetime.now(UTC) + timedelta(days=3)
+        test_session.expire_all()
+
+        result = await crm_tools.reschedule_appointment(appointment_id, new_time.isoformat())
+
+        assert result["success"] is True
+        entry = await test_session.scalar(select(CalendarSyncQueue))
+        assert entry is not None
+        assert entry.operation == "update"
+        assert entry.payload["notes"] == "Initial consultation"
+
+
+class TestListAppointments:
+    """Tests for listing appointments."""
+
+    @pytest.mark.asyncio
+    async def test_end_date_includes_whole_day_and_limit_applies(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that the end date is inclusive and results are capped in order."""
+        test_session.add_all(
+            [
+                Appointment(
+                    contact_id=contact.id,
+                    workspace_id=workspace.id,
+                    scheduled_at=datetime(2030, 1, day, 15, 0),
+                    status="scheduled",
+                )
+                for day in (17, 15, 16)
+            ]
+        )
+        await test_session.commit()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.list_appointments(
+            start_date="2030-01-15", end_date="2030-01-16", limit=5
+        )
+        limited = await crm_tools.list_appointments(start_date="2030-01-15", limit=1)
+
+        assert [apt["scheduled_at"][:10] for apt in result["appointments"]] == [
+            "2030-01-15",
+            "2030-01-16",
+        ]
+        assert result["appointments"][0]["customer_name"] == "Jane Smith"
+        assert limited["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lists_with_a_single_query(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that contact details don't cost a query per appointment."""
+        test_session.add_all(
+            [
+                Appointment(
+                    contact_id=contact.id,
+                    workspace_id=workspace.id,
+                    scheduled_at=datetime(2030, 1, 15, hour, 0),
+                    status="scheduled",
+                )
+                for hour in range(9, 14)
+            ]
+        )
+        await test_session.commit()
+        test_session.expunge_all()
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = test_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await crm_tools.list_appointments(start_date="2030-01-15")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result["total"] == 5
+        assert len(statements) == 1
+        assert "appointments.workspace_id = " in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_ymd_dates(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+    ) -> None:
+        """Test that only YYYY-MM-DD date filters are accepted."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        result = await crm_tools.list_appointments(start_date="2030-01-15T10:00")
+
+        assert result["success"] is False
+        assert "expected YYYY-MM-DD" in result["error"]
+
+
+class TestExecuteTool:
+    """Tests for dispatching tool calls by name."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_known_tools_and_rejects_unknown(
+        self,
+        test_session: AsyncSession,
+        workspace: Workspace,
+        contact: Contact,
+    ) -> None:
+        """Test that tool names route to their methods and unknown names error."""
+        crm_tools = CRMTools(db=test_session, user_id=workspace.user_id, workspace_id=workspace.id)
+
+        found = await crm_tools.execute_tool("search_customer", {"query": "Jane"})
+        unknown = await crm_tools.execute_tool("delete_everything", {})
+
+        assert found["customers"][0]["id"] == contact.id
+        assert unknown == {"success": False, "error": "Unknown tool: delete_everything"}
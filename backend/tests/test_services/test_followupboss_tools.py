@@ -0,0 +1,258 @@
+"""Tests for FollowUpBoss tools."""
+
+# ruff: noqa: SLF001
+
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import Callable
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.tools import followupboss_tools
+from app.services.tools.followupboss_tools import FollowUpBossTools, close_shared_clients
+from app.services.tools.registry import ToolRegistry
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+PERSON_RESPONSE = {
+    "id": 42,
+    "firstName": "Jane",
+    "lastName": "Doe",
+    "phones": [{"value": "+15551234567"}],
+    "emails": [{"value": "jane@example.com"}],
+}
+
+
+@pytest.fixture
+async def make_tools(monkeypatch):
+    """Factory for FollowUpBossTools whose HTTP client is served by a mock handler."""
+
+    def factory(handler: Handler) -> FollowUpBossTools:
+        tools = FollowUpBossTools(api_key="fub_key_mock")
+        client = httpx.AsyncClient(
+            base_url=followupboss_tools.FUB_BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(FollowUpBossTools, "_build_client", lambda _self: client)
+        return tools
+
+    yield factory
+    await close_shared_clients()
+
+
+class TestFollowUpBossCaching:
+    """Tests for short-lived person caches."""
+
+    @pytest.mark.asyncio
+    async def test_get_person_is_cached_until_updated(self, make_tools):
+        """Test that repeated lookups hit the API once and updates invalidate them."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=PERSON_RESPONSE)
+
+        tools = make_tools(handler)
+        first = await tools.fub_get_person("42")
+        second = await tools.fub_get_person("42")
+
+        assert first["person"]["name"] == "Jane Doe"
+        assert second == first
+        assert len(requests) == 1
+
+        await tools.fub_update_person("42", last_name="Smith")
+        await tools.fub_get_person("42")
+
+        assert [request.method for request in requests] == ["GET", "PUT", "GET"]
+
+    @pytest.mark.asyncio
+    async def test_mutating_a_result_does_not_corrupt_the_cache(self, make_tools):
+        """Test that callers editing a returned person don't change later results."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path == "/v1/people":
+                return httpx.Response(200, json={"people": [PERSON_RESPONSE]})
+            return httpx.Response(200, json=PERSON_RESPONSE)
+
+        tools = make_tools(handler)
+        fetched = await tools.fub_get_person("42")
+        fetched["person"]["first_name"] = "Bogus"
+        fetched["person"]["phones"].append("+15550000000")
+        cached = await tools.fub_get_person("42")
+        cached["person"]["emails"].clear()
+        found = await tools.fub_search_person("jane@example.com")
+        found["people"][0]["name"] = "Bogus"
+        found["people"].clear()
+
+        person = (await tools.fub_get_person("42"))["person"]
+        people = (await tools.fub_search_person("jane@example.com"))["people"]
+
+        assert person["first_name"] == "Jane"
+        assert person["phones"] == ["+15551234567"]
+        assert person["emails"] == ["jane@example.com"]
+        assert [p["name"] for p in people] == ["Jane Doe"]
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_update_sends_only_changed_fields(self, make_tools):
+        """Test that fields matching the cached person are not re-sent."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=PERSON_RESPONSE)
+
+        tools = make_tools(handler)
+        await tools.fub_get_person("42")
+
+        unchanged = await tools.fub_update_person("42", first_name="Jane", phone="+15551234567")
+        assert unchanged["success"] is True
+        assert [request.method for request in requests] == ["GET"]
+
+        await tools.fub_update_person("42", first_name="Jane", last_name="Smith")
+        assert json.loads(requests[-1].content) == {"lastName": "Smith"}
+
+    @pytest.mark.asyncio
+    async def test_phone_searches_share_a_cache_entry(self, make_tools):
+        """Test that differently formatted phone queries reuse one search."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"people": [PERSON_RESPONSE]})
+
+        tools = make_tools(handler)
+        first = await tools.fub_search_person("(555) 123-4567")
+        second = await tools.fub_search_person("555-123-4567")
+
+        assert first["people"][0]["id"] == 42
+        assert second == first
+        assert len(requests) == 1
+        assert requests[0].url.params["limit"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_create_clears_cached_search_misses(self, make_tools):
+        """Test that a person created after a miss is found by the next search."""
+        search_responses = [{"people": []}, {"people": [PERSON_RESPONSE]}]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": 42})
+            return httpx.Response(200, json=search_responses.pop(0))
+
+        tools = make_tools(handler)
+        result = await tools.fub_find_or_create_person("+15551234567", first_name="Jane")
+        found = await tools.fub_search_person("+15551234567")
+
+        assert result["created"] is True
+        assert found["found"] is True
+        assert search_responses == []
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_not_cached(self, make_tools):
+        """Test that errors are retried on the next call."""
+        responses = [httpx.Response(500, text="boom"), httpx.Response(200, json=PERSON_RESPONSE)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        tools = make_tools(handler)
+
+        assert (await tools.fub_get_person("42"))["success"] is False
+        assert (await tools.fub_get_person("42"))["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_search_cache_evicts_expired_and_oldest_entries(self, make_tools, monkeypatch):
+        """Test that the cache drops stale entries on write and stays under its cap."""
+        monkeypatch.setattr(followupboss_tools, "PERSON_CACHE_MAX_ENTRIES", 3)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"people": []})
+
+        tools = make_tools(handler)
+        stale_at = time.monotonic() - followupboss_tools.PERSON_CACHE_TTL_SECONDS - 1
+        tools._search_cache["stale"] = (stale_at, {"success": True, "found": False})
+
+        for name in ("ann", "bob", "cat", "dan"):
+            await tools.fub_search_person(name)
+
+        assert list(tools._search_cache) == ["bob", "cat", "dan"]
+
+
+class TestFollowUpBossLeads:
+    """Tests for lead creation."""
+
+    @pytest.mark.asyncio
+    async def test_create_lead_sends_json_payload(self, make_tools):
+        """Test that the event payload is sent as a JSON body."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"id": 7, "person": {"id": 42}})
+
+        tools = make_tools(handler)
+        result = await tools.fub_create_lead(
+            first_name="Jane",
+            phone="+15551234567",
+            email="jane@example.com",
+            message="Asked about listings",
+        )
+
+        assert result["success"] is True
+        assert result["person_id"] == 42
+        assert json.loads(sent[0].content) == {
+            "source": "Voice Agent",
+            "type": "Phone Lead",
+            "person": {
+                "firstName": "Jane",
+                "phones": [{"value": "+15551234567"}],
+                "emails": [{"value": "jane@example.com"}],
+            },
+            "message": "Asked about listings",
+        }
+
+
+class TestFollowUpBossConcurrentDispatch:
+    """Tests for running several FollowUpBoss tool calls from one turn together."""
+
+    @pytest.mark.asyncio
+    async def test_person_and_note_run_concurrently(self, make_tools, test_session: AsyncSession):
+        """Test that a person lookup and a note for the same person overlap."""
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if request.url.path == "/v1/notes":
+                return httpx.Response(201, json={"id": 7})
+            return httpx.Response(200, json=PERSON_RESPONSE)
+
+        make_tools(handler)
+        registry = ToolRegistry(
+            test_session,
+            user_id=1,
+            integrations={"followupboss": {"api_key": "fub_key_mock"}},
+            workspace_id=uuid.uuid4(),
+        )
+
+        person, note = await registry.execute_tools(
+            [
+                ("fub_get_person", {"person_id": "42"}),
+                ("fub_add_note", {"person_id": "42", "body": "Called about listing"}),
+            ]
+        )
+
+        assert peak == 2
+        assert person["person"]["id"] == 42
+        assert note["note_id"] == 7
+        await registry.close()
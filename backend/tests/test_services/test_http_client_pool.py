@@ -0,0 +1,81 @@
+"""Tests for the shared integration HTTP client pool."""
+
+# ruff: noqa: SLF001
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.tools.http_client_pool import SharedClientPool, _SharedClient
+
+
+def build_client() -> httpx.AsyncClient:
+    """Build a client that never reaches the network."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda _request: httpx.Response(204)))
+
+
+class TestSharedClientPool:
+    """Tests for the shared HTTP client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_shares_one_client_per_key(self):
+        """Test that users of one key reuse a single connection pool."""
+        pool = SharedClientPool("test")
+
+        first = pool.acquire("key_a", None, build_client)
+        second = pool.acquire("key_a", None, build_client)
+        other = pool.acquire("key_b", None, build_client)
+
+        assert first is second
+        assert first is not other
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_client_open_while_referenced(self):
+        """Test that the shared client is only closed by its last user."""
+        pool = SharedClientPool("test")
+        client = pool.acquire("key_a", None, build_client)
+        assert pool.acquire("key_a", None, build_client) is client
+        # Re-acquiring a client the caller already holds does not add a reference
+        assert pool.acquire("key_a", client, build_client) is client
+
+        await pool.release("key_a", client)
+        assert not client.is_closed
+        assert "key_a" in pool
+
+        await pool.release("key_a", client)
+        assert client.is_closed
+        assert "key_a" not in pool
+
+    @pytest.mark.asyncio
+    async def test_client_from_another_loop_is_replaced_and_closed(self):
+        """Test that a client bound to a previous event loop is closed, not orphaned."""
+        pool = SharedClientPool("test")
+        stale = build_client()
+        previous_loop = asyncio.new_event_loop()
+        pool._clients["key_a"] = _SharedClient(client=stale, loop=previous_loop, refs=1)
+
+        try:
+            client = pool.acquire("key_a", None, build_client)
+            assert client is not stale
+
+            # The stale client's holder releasing it must not touch the new client
+            await pool.release("key_a", stale)
+            await pool.close_all()
+        finally:
+            previous_loop.close()
+
+        assert stale.is_closed
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_every_client(self):
+        """Test that shutdown closes clients that are still referenced."""
+        pool = SharedClientPool("test")
+        clients = [pool.acquire(key, None, build_client) for key in ("key_a", "key_b")]
+
+        await pool.close_all()
+
+        assert all(client.is_closed for client in clients)
+        assert "key_a" not in pool